@@ -1,12 +1,17 @@
-from dataclasses import dataclass
-from typing import Dict
-from .ast import CallExpr, SigDecl, FuncDecl, PosArg, NamedArg, Expr
+from typing import Dict, Optional, Tuple
+from .ast import CallExpr, SigDecl, FuncDecl, Expr
 
-@dataclass
 class BindError(Exception):
-    message: str
+
+    def __init__(self, message: str, expected: Optional[Tuple[str, ...]] = None) -> None:
+        super().__init__(message)
+        self.message = message
+        self.expected = expected    # 候補の引数名（表示するときだけ join する）
+
     def __str__(self) -> str:
-        return self.message
+        if self.expected is None:
+            return self.message
+        return f"{self.message} (expected: {', '.join(self.expected)})"
 
 # =====================
 # Arg binding (positional vs named)
@@ -27,25 +32,21 @@ def bind_args(call: CallExpr, sig: SigDecl) -> Dict[str, Expr]:
             raise BindError(
                 f"argument count mismatch in call to {call.callee}: expected {expected}, got {got}"
             )
-        for pname, arg in zip(param_names, call.args):
-            assert isinstance(arg, PosArg)
-            bound[pname] = arg.expr
-        return bound
+        return dict(zip(param_names, call.args))
 
     if call.arg_style == "named":
         pset = set(param_names)
 
-        for arg in call.args:
-            assert isinstance(arg, NamedArg)
+        for name, expr in call.args:
 
-            if arg.name not in pset:
+            if name not in pset:
                 raise BindError(
-                    f"unknown named argument '{arg.name}' in call to {call.callee} "
-                    f"(expected: {', '.join(param_names)})"
+                    f"unknown named argument '{name}' in call to {call.callee}",
+                    expected=param_names,
                 )
-            if arg.name in bound:
-                raise BindError(f"duplicate named argument '{arg.name}' in call to {call.callee}")
-            bound[arg.name] = arg.expr
+            if name in bound:
+                raise BindError(f"duplicate named argument '{name}' in call to {call.callee}")
+            bound[name] = expr
 
         missing = [p for p in param_names if p not in bound]
         if missing:
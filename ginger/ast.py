@@ -1,15 +1,24 @@
+import sys
 from dataclasses import dataclass, field
-from typing import List, Union
+from typing import Dict, Final, Tuple, Union
 # from ginger.core.failure_spec import FailureSet, EMPTY_FAILURES
 
 
 # =====================
 # AST
 # =====================
+# ノードは slots=True（__dict__ なし）。キャッシュ用の欄を除き、生成後に書き換えないこと。
+# キャッシュ欄を持たない宣言系ノードは frozen=True。
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class Program:
-    items: List["TopLevel"]
+    items: Tuple["TopLevel", ...]
+
+    # lower.program_blocks のキャッシュ（try と後続の catch をまとめた並び）
+    blocks: list | None = field(default=None, init=False, repr=False, compare=False)
+
+    # eval_program のキャッシュ: (prelude, トップレベルの文のクロージャ)
+    code: tuple | None = field(default=None, init=False, repr=False, compare=False)
 
 
 TopLevel = Union[
@@ -38,35 +47,60 @@ Stmt = Union[
     "ReturnStmt", 
     ]
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class BlockStmt:
-    stmts: List[Stmt]
+    stmts: Tuple[Stmt, ...]
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class ReturnStmt:
     expr: "Expr"
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class TryStmt:
     expr: "Expr"
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class CatchStmt:
     failure_name: str
     expr: "Expr"
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
+class TryBlock:
+    """TryStmt と、その直後に連なる CatchStmt の組（パース結果には現れない）"""
+    try_stmt: TryStmt
+    catches: Tuple[CatchStmt, ...]
+
+    # failure 名 -> catch（同名が複数あれば先のものが勝つ）
+    catch_map: Dict[str, CatchStmt] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        catch_map: Dict[str, CatchStmt] = {}
+        for c in self.catches:
+            catch_map.setdefault(c.failure_name, c)
+        self.catch_map = catch_map
+
+@dataclass(slots=True)
 class ExprStmt:
     expr: "Expr"
 
 
 # ---types ---
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TypeRef:
     name: str  # Int, Float, String, Self, T, Number, etc.
 
-@dataclass(frozen=True)
+_TYPEREF_CACHE: Dict[str, TypeRef] = {}
+
+def type_ref(name: str) -> TypeRef:
+    """同名の TypeRef は一つだけ作って使い回す"""
+    t = _TYPEREF_CACHE.get(name)
+    if t is None:
+        name = sys.intern(name)
+        t = _TYPEREF_CACHE[name] = TypeRef(name)
+    return t
+
+@dataclass(frozen=True, slots=True)
 class Param:
     name: str
     typ: TypeRef
@@ -74,24 +108,24 @@ class Param:
 
 # --- guarantee/typegroup/register ---
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FuncSig:
     name: str
-    params: List[Param]
+    params: Tuple[Param, ...]
     ret: TypeRef
-    attrs: List[str] = field(default_factory=list)
+    attrs: Tuple[str, ...] = ()
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GuaranteeDecl:
     name: str
-    methods: List[FuncSig]  # signatures inside guarantee
+    methods: Tuple[FuncSig, ...]  # signatures inside guarantee
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TypeGroupDecl:
     name: str
-    members: List[TypeRef]  # Int | Float | ...
+    members: Tuple[TypeRef, ...]  # Int | Float | ...
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegisterDecl:
     typ: TypeRef
     guarantee: str
@@ -99,28 +133,31 @@ class RegisterDecl:
 
 # ---- impl (legacy: builtin mapping) ----
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class ImplMethod:
     name: str        # add
     builtin: str     # core.int.add
 
-@dataclass(frozen=True)
+    def __post_init__(self) -> None:
+        self.builtin = sys.intern(self.builtin)
+
+@dataclass(frozen=True, slots=True)
 class ImplDecl:
     typ: TypeRef
     guarantee: str
-    methods: List[ImplMethod]
+    methods: Tuple[ImplMethod, ...]
 
 
 # ---- require clauses ----
 
 RequireClause = Union["RequireIn", "RequireGuarantees"]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RequireIn:
     type_var: str     # T
     group_name: str   # Number
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RequireGuarantees:
     type_var: str         # T
     guarantee_name: str   # Addable
@@ -128,34 +165,50 @@ class RequireGuarantees:
 
 # --- sig / func ---
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class SigDecl:
     name: str
-    params: List[TypeRef]
+    params: Tuple[TypeRef, ...]
     ret: TypeRef
-    requires: List[RequireClause]
-    failures: list[str] = field(default_factory=list)
-    attrs: list[str] = field(default_factory=list)
+    requires: Tuple[RequireClause, ...]
+    failures: Tuple[str, ...] = ()
+    attrs: Tuple[str, ...] = ()
     builtin: str | None = None
 
-@dataclass(frozen=True)
+    # 実行時 dispatch 用: require T guarantees G の G 一覧（dispatch できるのは一つだけの時）
+    guarantee_names: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.guarantee_names = tuple(
+            r.guarantee_name for r in self.requires if isinstance(r, RequireGuarantees)
+        )
+        if self.builtin is not None:
+            self.builtin = sys.intern(self.builtin)
+
+@dataclass(slots=True)
 class FuncDecl:
     name: str
-    params: List[Param]
+    params: Tuple[Param, ...]
     body: BlockStmt
-    attrs: list[str] = field(default_factory=list)
+    attrs: Tuple[str, ...] = ()
+
+    # 呼び出しごとの p.name 参照を避ける
+    param_names: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.param_names = tuple(p.name for p in self.params)
 
 
 # ---- code (binding) ----
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class VarDecl:
     mutable: bool
     typ: TypeRef
     name: str
     expr: "Expr"
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class AssignStmt:
     name: str
     expr: "Expr"
@@ -170,37 +223,36 @@ Expr = Union[
     "FloatLit", 
     ]
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class IdentExpr:
     name: str
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class IntLit:
     value: int
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class FloatLit:
     value: float
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class BinaryExpr:
     op: str     # { + | - | * | / }
     left: Expr
     right: Expr
 
-@dataclass(frozen=True)
-class PosArg:
-    expr: Expr
-
-@dataclass(frozen=True)
-class NamedArg:
-    name: str
-    expr: Expr
+# CallExpr.args の形は arg_style で決まる
+#   "pos"   -> Tuple[Expr, ...]
+#   "named" -> Tuple[Tuple[str, Expr], ...]
+Arg = Union[Expr, Tuple[str, Expr]]
 
-Arg = Union[PosArg, NamedArg]
-
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class CallExpr:
     callee: str
-    args: List[Arg]
-    arg_style: str  # "pos" or "named"
\ No newline at end of file
+    args: Tuple[Arg, ...]
+    arg_style: str  # "pos" or "named"
+
+
+# ---- isinstance 用の型タプル（呼び出しごとに作らない） ----
+
+LEAF_EXPR_TYPES: Final = (IdentExpr, IntLit, FloatLit)
@@ -3,7 +3,7 @@ from typing import Dict, Literal, Optional
 
 AttrKind = Literal["meta", "sem"]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AttrDef:
     name: str
     kind: AttrKind
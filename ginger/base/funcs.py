@@ -1,4 +1,5 @@
-from ginger.errors import EvalError
+from types import MappingProxyType
+from ..errors import EvalError
 
 def add(args, dispatch):
     
@@ -19,7 +20,7 @@ def breath(args, dispatch):
         raise EvalError("internal error: breath expects 0 args")
     return dispatch.unit_value()
     
-BASE_FUNCS = {
+BASE_FUNCS = MappingProxyType({
     "add": add,
     "breath": breath,
-}
\ No newline at end of file
+})
\ No newline at end of file
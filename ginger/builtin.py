@@ -1,4 +1,7 @@
-from typing import Callable, Dict, Any, Literal, Tuple
+import operator
+import sys
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Literal, Mapping, Tuple
 
 # いまのランタイム値（必要なら ginger/eval.py 側の Value と合わせる）
 Value = Any
@@ -11,22 +14,24 @@ OrderingValue = Tuple[str, OrderingTag]     # ("Ordering", tag)
 def ordering(tag: OrderingTag) -> OrderingValue:
     return ("Ordering", tag)
 
-BUILTINS: Dict[str, BuiltinFn] = {
+_BUILTINS: Dict[str, BuiltinFn] = {
 
-    "core.int.add":   lambda a, b: a + b,
-    "core.float.add": lambda a, b: a + b,
+    # 四則は operator の C 実装をそのまま使う（Python フレームを積まない）
+    "core.int.add":   operator.add,
+    "core.float.add": operator.add,
 
-    "core.int.sub":   lambda a, b: a - b,
-    "core.float.sub": lambda a, b: a - b,
+    "core.int.sub":   operator.sub,
+    "core.float.sub": operator.sub,
 
-    "core.int.mul":   lambda a, b: a * b,
-    "core.float.mul": lambda a, b: a * b,
+    "core.int.mul":   operator.mul,
+    "core.float.mul": operator.mul,
 
-    "core.float.div": lambda a, b: a / b,
+    "core.float.div": operator.truediv,
 
-    "core.int.neg": lambda a: -a,
-    "core.float.neg": lambda a:-a,
+    "core.int.neg": operator.neg,
+    "core.float.neg": operator.neg,
     
+    # float は引数 0 個でも通る（0.0 になる）ので、1 引数に固定するため lambda で包む
     "core.int.toFloat": lambda a: float(a),
 
     "core.int.print":     lambda x: (print(x), None)[1],  # Unit は None 表現
@@ -46,12 +51,7 @@ BUILTINS: Dict[str, BuiltinFn] = {
     # "core.float.gt":  lambda a, b: a > b,
 }
 
-def has_builtin(builtin_id: str) -> bool:
-    return builtin_id in BUILTINS
-
-def call_builtin(builtin_id: str, *args: Value) -> Value:
-    try:
-        fn = BUILTINS[builtin_id]
-    except KeyError as e:
-        raise KeyError(f"unknown builtin '{builtin_id}'") from e
-    return fn(*args)
\ No newline at end of file
+# 読み取り専用。キーは intern して、読み込み側の id と同一オブジェクトで比較できるようにする
+BUILTINS: Mapping[str, BuiltinFn] = MappingProxyType(
+    {sys.intern(k): fn for k, fn in _BUILTINS.items()}
+)
@@ -0,0 +1,372 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .errors import EvalError
+from .runtime.failures import RaisedFailure, FailureId
+from .builtin import BUILTINS
+
+from .ast import (
+    FuncDecl,
+    Expr,
+    CallExpr,
+    BinaryExpr,
+    IdentExpr,
+    IntLit,
+    FloatLit,
+    BlockStmt,
+    ReturnStmt,
+    ExprStmt,
+)
+
+
+# =====================
+# Closure compiler
+# =====================
+# 式を (env, outer) -> Value のクロージャに変換する。
+# 呼び出し先の解決や引数の並びは変換時に一度だけ済ませ、実行時には AST を見ない。
+# 解決できない呼び出しなどのエラーは、従来どおり「その式を評価した時」に送出する。
+#
+# func 本文の中では env は引数のリストで、引数名は変換時に添字（slot）へ置き換える。
+# 引数以外の名前は outer（トップレベルの env）から引く。
+
+#Value = Union[int, float]
+Value = Any
+
+# 束縛名 -> 値。可変性（let/var）は代入の時しか見ないので別の set で持つ
+Env = Dict[str, Value]
+
+Code = Callable[[Env, Optional[Env]], Value]
+
+# func 本文での 引数名 -> local の添字
+Slots = Dict[str, int]
+
+# func 本文: (引数, 呼び出し側の env) -> 戻り値
+FuncCode = Callable[[List[Value], Env], Value]
+
+_MISSING = object()
+
+
+class Compiler:
+    """syms ごとに一つ。func 本文は初回の呼び出しで変換してキャッシュする。"""
+
+    __slots__ = ("syms", "_funcs")
+
+    def __init__(self, syms) -> None:
+        self.syms = syms
+        self._funcs: Dict[str, FuncCode] = {}
+
+    # ---- expressions ----
+
+    def expr(self, expr: Expr, slots: Optional[Slots] = None) -> Code:
+        t = type(expr)
+
+        if t is IntLit or t is FloatLit:
+            return _const(expr.value)    # parser が int / float にして渡している
+
+        if t is IdentExpr:
+            if slots is None:
+                return _ident(expr.name)
+            i = slots.get(expr.name)
+            if i is None:
+                return _outer_ident(expr.name)
+            return _slot(i)
+
+        if t is CallExpr:
+            return self.call(expr, slots)
+
+        if t is BinaryExpr:
+            # 実行時には BinaryExpr 用の dispatch を持たない
+            return _fail(f"BinaryExpr must be lowered before eval (run lower_program): {expr!r}")
+
+        return _fail(f"unsupported expr node: {expr!r}")
+
+    def call(self, expr: CallExpr, slots: Optional[Slots] = None) -> Code:
+
+        if expr.arg_style != "pos":
+            return _fail(f"named args not supported at runtime for '{expr.callee}'")
+
+        args = tuple(self.expr(a, slots) for a in expr.args)
+        syms = self.syms
+
+        # user func があればそちらで対応（既存の仕様があれば維持）
+        fdecl = syms.funcs.get(expr.callee)
+        if fdecl is not None:
+            return self._user_call(fdecl, args, in_func=slots is not None)
+
+        # sig 呼び出しなら impl 経由で builtin に落とす
+        sig = syms.sigs.get(expr.callee)
+        if sig is not None:
+
+            # sig に builtin が直結していたら、それを呼ぶ（requires不要）
+            if sig.builtin is not None:
+                fn = BUILTINS.get(sig.builtin)
+                if fn is None:
+                    return _fail_after_args(args, f"unknown builtin '{sig.builtin}'")
+                return _builtin_call(fn, args)
+
+            guars = sig.guarantee_names
+
+            if len(guars) != 1:
+                return _fail_after_args(
+                    args,
+                    f"sig '{sig.name}' must have exactly 1 'require T guarantees G' for runtime dispatch (got {len(guars)})",
+                )
+
+            # Self の具象型を引数から決める（四則は左右同型を想定）
+            if not args:
+                return _fail(f"sig '{sig.name}' needs args for runtime dispatch")
+
+            return _impl_call(syms, guars[0], sig.name, args)
+
+        return _fail_after_args(args, f"function '{expr.callee}' has no runtime implementation yet")
+
+    def _user_call(self, fdecl: FuncDecl, args: Tuple[Code, ...], in_func: bool) -> Code:
+        run: Optional[FuncCode] = None
+
+        # 呼ばれた側の outer はトップレベルの env（func の中からなら自分の outer を渡す）
+        if in_func:
+            def _call(env, outer: Optional[Env]) -> Value:
+                nonlocal run
+                vals = [a(env, outer) for a in args]
+                if run is None:
+                    run = self.func(fdecl)   # 再帰があるので本文は遅延して変換する
+                return run(vals, outer)
+        else:
+            def _call(env: Env, outer: Optional[Env]) -> Value:
+                nonlocal run
+                vals = [a(env, outer) for a in args]
+                if run is None:
+                    run = self.func(fdecl)
+                return run(vals, env)
+
+        return _call
+
+    # ---- statements ----
+
+    def block(self, block: BlockStmt, slots: Optional[Slots] = None) -> Tuple[Tuple[Code, ...], Optional[Code]]:
+        """func 本文を (先頭から順に評価する式, return の式) にする。return 以降は実行されない。"""
+        stmts: List[Code] = []
+        ret: Optional[Code] = None
+
+        for st in block.stmts:
+            t = type(st)
+            if t is ExprStmt:
+                stmts.append(self.expr(st.expr, slots))
+            elif t is ReturnStmt:
+                ret = self.expr(st.expr, slots)
+                break
+            else:
+                # 今は ReturnStmt / ExprStmt のみ対応
+                stmts.append(_fail(f"unsupported statement in func body: {st!r}"))
+                break
+
+        return tuple(stmts), ret
+
+    def func(self, fdecl: FuncDecl) -> FuncCode:
+        run = self._funcs.get(fdecl.name)
+        if run is None:
+            run = self._funcs[fdecl.name] = self._compile_func(fdecl)
+        return run
+
+    def _compile_func(self, fdecl: FuncDecl) -> FuncCode:
+
+        fname = fdecl.name
+        param_names = fdecl.param_names
+        n = len(param_names)
+        handled = fname in self.syms.handled
+        stmts, ret = self.block(fdecl.body, {name: i for i, name in enumerate(param_names)})
+
+        def _run(args: List[Value], caller_env: Env) -> Value:
+
+            if len(args) != n:
+                raise EvalError(
+                    f"argument count mismatch in call to {fname}: expected {n}, got {len(args)}"
+                )
+
+            # local は引数のリストそのもの（引数名は slot 添字で引く）
+            local = args
+
+            try:
+                for st in stmts:
+                    st(local, caller_env)
+                return None if ret is None else ret(local, caller_env)   # return が無ければ Unit
+            except RaisedFailure:
+                # @attr.handled: swallow failures of this sig
+                if handled:
+                    return None
+                raise
+
+        return _run
+
+
+# =====================
+# Node closures
+# =====================
+
+def _const(v: Value) -> Code:
+    return lambda env, outer: v
+
+def _ident(name: str) -> Code:
+
+    def _load(env: Env, outer: Optional[Env]) -> Value:
+        v = env.get(name, _MISSING)
+        if v is _MISSING:
+            return _lookup_outer(outer, name)
+        return v
+
+    return _load
+
+def _slot(i: int) -> Code:
+    return lambda local, outer: local[i]
+
+def _outer_ident(name: str) -> Code:
+    return lambda local, outer: _lookup_outer(outer, name)
+
+def _lookup_outer(outer: Optional[Env], name: str) -> Value:
+    if outer is not None and name in outer:
+        return outer[name]
+    raise EvalError(f"unknown identifier '{name}'")
+
+def _fail(message: str) -> Code:
+
+    def _raise(env: Env, outer: Optional[Env]) -> Value:
+        raise EvalError(message)
+
+    return _raise
+
+def _fail_after_args(args: Tuple[Code, ...], message: str) -> Code:
+    # 従来どおり、引数を評価してからエラーにする
+    def _raise(env: Env, outer: Optional[Env]) -> Value:
+        for a in args:
+            a(env, outer)
+        raise EvalError(message)
+
+    return _raise
+
+def _builtin_call(fn: Callable[..., Value], args: Tuple[Code, ...]) -> Code:
+
+    # 四則などの 1〜2 引数はリストを作らずに呼ぶ
+    if len(args) == 1:
+        a0, = args
+
+        def _call1(env: Env, outer: Optional[Env]) -> Value:
+            v0 = a0(env, outer)
+            try:
+                return fn(v0)
+            except ZeroDivisionError:
+                raise RaisedFailure(FailureId.DivideByZero) from None
+
+        return _call1
+
+    if len(args) == 2:
+        a0, a1 = args
+
+        def _call2(env: Env, outer: Optional[Env]) -> Value:
+            v0 = a0(env, outer)
+            v1 = a1(env, outer)
+            try:
+                return fn(v0, v1)
+            except ZeroDivisionError:
+                raise RaisedFailure(FailureId.DivideByZero) from None
+
+        return _call2
+
+    def _call(env: Env, outer: Optional[Env]) -> Value:
+        vals = [a(env, outer) for a in args]
+        try:
+            return fn(*vals)
+        except ZeroDivisionError:
+            raise RaisedFailure(FailureId.DivideByZero) from None
+
+    return _call
+
+def _impl_call(syms, guar: str, sig_name: str, args: Tuple[Code, ...]) -> Code:
+    """
+    先頭引数の実行時の型で impl を選ぶ。
+    直前の Python 型と builtin 関数を一組だけ覚える（monomorphic）。
+    """
+    impl_fns = syms.impl_fns
+    mono_type: Optional[type] = None
+    mono_fn: Optional[Callable[..., Value]] = None
+
+    def _select(v0: Value) -> Callable[..., Value]:
+        nonlocal mono_type, mono_fn
+
+        pyt = type(v0)
+        if pyt is mono_type:
+            return mono_fn
+
+        t0 = _runtime_type(v0)
+        key = (t0, guar, sig_name)      # (Type, Guarantee, Method)
+        fn = impl_fns.get(key)
+
+        if fn is None:
+            builtin_id = syms.impls.get(key)
+            if builtin_id is None:
+                raise EvalError(f"no impl for {t0} guarantees {guar}.{sig_name}")
+            # impl はあるが builtin 名が解決できなかった
+            raise EvalError(f"unknown builtin '{builtin_id}'")
+
+        # tuple は中身で型が決まる（Ordering）ので覚えない
+        if pyt is not tuple:
+            mono_type, mono_fn = pyt, fn
+        return fn
+
+    if len(args) == 1:
+        a0, = args
+
+        def _call1(env: Env, outer: Optional[Env]) -> Value:
+            v0 = a0(env, outer)
+            fn = _select(v0)
+            try:
+                return fn(v0)
+            except ZeroDivisionError:
+                raise RaisedFailure(FailureId.DivideByZero) from None
+
+        return _call1
+
+    if len(args) == 2:
+        a0, a1 = args
+
+        def _call2(env: Env, outer: Optional[Env]) -> Value:
+            v0 = a0(env, outer)
+            v1 = a1(env, outer)
+            fn = _select(v0)
+            try:
+                return fn(v0, v1)
+            except ZeroDivisionError:
+                raise RaisedFailure(FailureId.DivideByZero) from None
+
+        return _call2
+
+    def _call(env: Env, outer: Optional[Env]) -> Value:
+        vals = [a(env, outer) for a in args]
+        fn = _select(vals[0])
+        try:
+            return fn(*vals)
+        except ZeroDivisionError:
+            raise RaisedFailure(FailureId.DivideByZero) from None
+
+    return _call
+
+
+# =====================
+# Runtime types
+# =====================
+
+_RUNTIME_TYPE = {
+    bool: "Bool",
+    int: "Int",
+    float: "Float",
+    str: "String",
+    type(None): "Unit",
+}
+
+def _runtime_type(v):
+    t = _RUNTIME_TYPE.get(type(v))
+    if t is not None:
+        return t
+    if (isinstance(v, tuple)
+        and len(v) == 2
+        and v[0] == "Ordering"
+        and v[1] in ("Left", "Flat", "Right")):
+        return "Ordering"
+    raise EvalError(f"unknown runtime value type: {type(v)}")
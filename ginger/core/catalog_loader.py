@@ -1,12 +1,15 @@
 import json
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Union
 
-from ginger.ast import (
+from ..ast import (
     GuaranteeDecl,
     FuncSig,
     Param,
     TypeRef,
+    type_ref,
     ImplDecl,
     ImplMethod,
     SigDecl,
@@ -23,9 +26,9 @@ def _type_ref(obj: Any) -> TypeRef:
         - "Int"     (optional convenience)
     """
     if isinstance(obj, str):
-        return TypeRef(obj)
+        return type_ref(obj)
     if isinstance(obj, dict) and "ref" in obj and isinstance(obj["ref"], str):
-        return TypeRef(obj["ref"])
+        return type_ref(obj["ref"])
     raise ValueError(f"Invalid type ref: {obj!r}")
 
 
@@ -41,7 +44,13 @@ def _param(obj: Any) -> Param:
     if not isinstance(name, str):
         raise ValueError(f"Param.name must be str: {obj!r}")
     t = obj.get("type", obj.get("typ"))
-    return Param(name, _type_ref(t))
+    return _make_param(name, _type_ref(t))
+
+
+@lru_cache(maxsize=None)
+def _make_param(name: str, typ: TypeRef) -> Param:
+    # 同じ (name, type) の Param は catalog 全体で一つを共有する
+    return Param(sys.intern(name), typ)
 
 
 def _require(obj: Any):
@@ -58,7 +67,86 @@ def _require(obj: Any):
     guarantee = obj.get("guarantee")
     if not isinstance(type_var, str) or not isinstance(guarantee, str):
         raise ValueError(f"Invalid guarantees require: {obj!r}")
-    return RequireGuarantees(type_var=type_var, guarantee_name=guarantee)
+    return _make_require_guarantees(type_var, guarantee)
+
+
+@lru_cache(maxsize=None)
+def _make_require_guarantees(type_var: str, guarantee: str) -> RequireGuarantees:
+    return RequireGuarantees(type_var=sys.intern(type_var), guarantee_name=sys.intern(guarantee))
+
+
+def _func_sig(m: Any) -> FuncSig:
+    if not isinstance(m, dict):
+        raise ValueError(f"Invalid guarantee method: {m!r}")
+    mname = m.get("name")
+    if not isinstance(mname, str):
+        raise ValueError(f"FuncSig.name must be str: {m!r}")
+    return FuncSig(
+        name=sys.intern(mname),
+        params=tuple(_param(x) for x in m.get("params", [])),
+        ret=_type_ref(m.get("ret")),
+    )
+
+
+def _guarantee(g: Any) -> GuaranteeDecl:
+    if not isinstance(g, dict):
+        raise ValueError(f"Invalid guarantee: {g!r}")
+    gname = g.get("name")
+    if not isinstance(gname, str):
+        raise ValueError(f"Guarantee.name must be str: {g!r}")
+    return GuaranteeDecl(name=sys.intern(gname), methods=tuple(_func_sig(m) for m in g.get("methods", [])))
+
+
+def _impl_method(m: Any) -> ImplMethod:
+    if not isinstance(m, dict):
+        raise ValueError(f"Invalid impl method: {m!r}")
+    mname = m.get("name")
+    builtin = m.get("builtin")
+    if not isinstance(mname, str) or not isinstance(builtin, str):
+        raise ValueError(f"ImplMethod fields invalid: {m!r}")
+    return ImplMethod(name=sys.intern(mname), builtin=builtin)
+
+
+def _impl(imp: Any) -> ImplDecl:
+    if not isinstance(imp, dict):
+        raise ValueError(f"Invalid impl: {imp!r}")
+    typ = _type_ref(imp.get("type", imp.get("typ")))
+    guarantee = imp.get("guarantee")
+    if not isinstance(guarantee, str):
+        raise ValueError(f"Impl.guarantee must be str: {imp!r}")
+    return ImplDecl(
+        typ=typ,
+        guarantee=sys.intern(guarantee),
+        methods=tuple(_impl_method(m) for m in imp.get("methods", [])),
+    )
+
+
+def _sig(s: Any) -> SigDecl:
+    if not isinstance(s, dict):
+        raise ValueError(f"Invalid sig: {s!r}")
+    sname = s.get("name")
+    if not isinstance(sname, str):
+        raise ValueError(f"Sig.name must be str: {s!r}")
+
+    params = tuple(_type_ref(x) for x in s.get("params", []))
+    ret = _type_ref(s.get("ret"))
+    requires = tuple(_require(x) for x in s.get("requires", []))
+    builtin = s.get("builtin")
+    if builtin is not None and not isinstance(builtin, str):
+        raise ValueError(
+            f"Sig '{sname}' is missing 'builtin': "
+            "use null to indicate 'intentionally nobuiltin'"
+        )
+
+    return SigDecl(
+        name=sys.intern(sname),
+        params=params,
+        ret=ret,
+        requires=requires,
+        failures=tuple(s.get("failures", ())),
+        attrs=tuple(s.get("attrs", ())),
+        builtin=builtin,
+    )
 
 
 def load_core_catalog_json(path: Union[str, Path]) -> List[Any]:
@@ -71,81 +159,7 @@ def load_core_catalog_json(path: Union[str, Path]) -> List[Any]:
     if not isinstance(data, dict):
         raise ValueError("Catalog JSON root must be an object")
 
-    out: List[Any] = []
-
-    # --- guarantees ---
-    for g in data.get("guarantees", []):
-        if not isinstance(g, dict):
-            raise ValueError(f"Invalid guarantee: {g!r}")
-        gname = g.get("name")
-        if not isinstance(gname, str):
-            raise ValueError(f"Guarantee.name must be str: {g!r}")
-
-        methods: List[FuncSig] = []
-        for m in g.get("methods", []):
-            if not isinstance(m, dict):
-                raise ValueError(f"Invalid guarantee method: {m!r}")
-            mname = m.get("name")
-            if not isinstance(mname, str):
-                raise ValueError(f"FuncSig.name must be str: {m!r}")
-
-            params = [_param(x) for x in m.get("params", [])]
-            ret = _type_ref(m.get("ret"))
-            methods.append(FuncSig(name=mname, params=params, ret=ret))
-
-        out.append(GuaranteeDecl(name=gname, methods=methods))
-
-    # --- impls ---
-    for imp in data.get("impls", []):
-        if not isinstance(imp, dict):
-            raise ValueError(f"Invalid impl: {imp!r}")
-        typ = _type_ref(imp.get("type", imp.get("typ")))
-        guarantee = imp.get("guarantee")
-        if not isinstance(guarantee, str):
-            raise ValueError(f"Impl.guarantee must be str: {imp!r}")
-
-        methods: List[ImplMethod] = []
-        for m in imp.get("methods", []):
-            if not isinstance(m, dict):
-                raise ValueError(f"Invalid impl method: {m!r}")
-            mname = m.get("name")
-            builtin = m.get("builtin")
-            if not isinstance(mname, str) or not isinstance(builtin, str):
-                raise ValueError(f"ImplMethod fields invalid: {m!r}")
-            methods.append(ImplMethod(name=mname, builtin=builtin))
-
-        out.append(ImplDecl(typ=typ, guarantee=guarantee, methods=methods))
-
-    # --- sigs ---
-    for s in data.get("sigs", []):
-        if not isinstance(s, dict):
-            raise ValueError(f"Invalid sig: {s!r}")
-        sname = s.get("name")
-        if not isinstance(sname, str):
-            raise ValueError(f"Sig.name must be str: {s!r}")
-
-        params = [_type_ref(x) for x in s.get("params", [])]
-        ret = _type_ref(s.get("ret"))
-        requires = [_require(x) for x in s.get("requires", [])]
-        failures = s.get("failures", [])
-        attrs = s.get("attrs", [])
-        builtin = s.get("builtin")
-        if builtin is not None and not isinstance(builtin, str):
-            raise ValueError(
-                f"Sig '{sname}' is missing 'builtin': "
-                "use null to indicate 'intentionally nobuiltin'"
-            )
-
-        out.append(
-            SigDecl(
-                name=sname,
-                params=params,
-                ret=ret,
-                requires=requires,
-                failures=failures,
-                attrs=attrs,
-                builtin=builtin,
-            )
-        )
-
-    return out
\ No newline at end of file
+    out: List[Any] = [_guarantee(g) for g in data.get("guarantees", [])]
+    out += [_impl(imp) for imp in data.get("impls", [])]
+    out += [_sig(s) for s in data.get("sigs", [])]
+    return out
@@ -1,5 +1,6 @@
 from enum import Enum
-from typing import FrozenSet
+from itertools import combinations
+from typing import Dict, FrozenSet
 
 class FailureId(str, Enum):
     PrintErr = "PrintErr"
@@ -11,33 +12,48 @@ class FailureId(str, Enum):
 
 # --- FailureSet (effect) ---
 FailureSet = FrozenSet[FailureId]
-EMPTY_FAILURES: FailureSet = frozenset()
+
+# FailureId は有限なので、取り得る FailureSet を全部先に作って使い回す
+_ALL_FAILURESETS: Dict[FailureSet, FailureSet] = {
+    fs: fs
+    for fs in (
+        frozenset(c)
+        for r in range(len(FailureId) + 1)
+        for c in combinations(FailureId, r)
+    )
+}
+
+def _intern(s: FailureSet) -> FailureSet:
+    return _ALL_FAILURESETS.get(s, s)
+
+EMPTY_FAILURES: FailureSet = _intern(frozenset())
 
 def failures(*ids: FailureId) -> FailureSet:
     """Build a FailureSet from given ids."""
-    return frozenset(ids)
+    return _intern(frozenset(ids))
+
+_SINGLETONS: Dict[FailureId, FailureSet] = {f: failures(f) for f in FailureId}
 
 def union_failures(*sets) -> FailureSet:
     """Union multipie FailureSets."""
-    out = set()
+    if __debug__:
+        for i, s in enumerate(sets):
+            if isinstance(s, type):
+                raise TypeError(f"union_failures arg[{i}] is TYPE: {s!r}")
+
+    nonempty = [s for s in sets if s]
 
-    for i, s in enumerate(sets):
-        if s is None:
-            continue
-        if isinstance(s, type):
-            raise TypeError(f"union_failures arg[{i}] is TYPE: {s!r}")
-        out.update(s)
+    if not nonempty:
+        return EMPTY_FAILURES
+    if len(nonempty) == 1:
+        return _intern(frozenset(nonempty[0]))
 
-    return frozenset(out)
+    return _intern(frozenset().union(*nonempty))
 
     
 def remove_failure(s: FailureSet, fid: FailureId) -> FailureSet:
     """Remove one failure id (for catch)."""
-    if fid not in s:
-        return s
-    
-    # frozenset supports set difference
-    return frozenset(set(s) - {fid})
+    return _intern(s - _SINGLETONS[fid]) if fid in s else s
 
 def contains_failure(s: FailureSet, fid: FailureId) -> bool:
     return fid in s
\ No newline at end of file
@@ -1,5 +1,5 @@
 """
-from ginger.ast import (
+from ..ast import (
     GuaranteeDecl, 
     FuncSig,
     Param,
@@ -1,15 +1,33 @@
 from pathlib import Path
-from ginger.core.catalog_loader import load_core_catalog_json
-
-def _core_items(name: str):
-    root = Path(__file__).parents[1]
-    catalog = root / "catalog" / f"{name}.json"
-    return load_core_catalog_json(catalog)
-
-def prelude_items():
-    items = []
-    items += _core_items("math")
-    items += _core_items("cast")
-    items += _core_items("ordering")
-    items += _core_items("io")
-    return items
\ No newline at end of file
+from typing import Any, Dict, Tuple
+from .catalog_loader import load_core_catalog_json
+
+_CATALOG_DIR = Path(__file__).parents[1] / "catalog"
+_PRELUDE_CATALOGS = ("math", "cast", "ordering", "io")
+
+# catalog path -> (st_mtime_ns, items)。ファイルが変わっていなければ読み直さない
+_CATALOG_CACHE: Dict[Path, Tuple[int, Tuple[Any, ...]]] = {}
+
+# 直前に組み立てた prelude: (各 catalog の items, 連結結果)
+_prelude_cache: Tuple[Tuple[Tuple[Any, ...], ...], Tuple[Any, ...]] | None = None
+
+def _core_items(name: str) -> Tuple[Any, ...]:
+    catalog = _CATALOG_DIR / f"{name}.json"
+    mt = catalog.stat().st_mtime_ns
+    hit = _CATALOG_CACHE.get(catalog)
+    if hit is not None and hit[0] == mt:
+        return hit[1]
+    items = tuple(load_core_catalog_json(catalog))
+    _CATALOG_CACHE[catalog] = (mt, items)
+    return items
+
+def prelude_items() -> Tuple[Any, ...]:
+    # 結果は共有する（呼び出し側で書き換えないこと）
+    global _prelude_cache
+    parts = tuple(_core_items(name) for name in _PRELUDE_CATALOGS)
+    cached = _prelude_cache
+    if cached is not None and all(a is b for a, b in zip(cached[0], parts)):
+        return cached[1]
+    items = sum(parts, ())
+    _prelude_cache = (parts, items)
+    return items
@@ -3,7 +3,7 @@ from typing import List, Literal, Optional
 
 Level = Literal["warning", "note"]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Diagnostic:
     level: Level
     code: str
@@ -12,6 +12,8 @@ class Diagnostic:
 
 class Diagnostics:
 
+    __slots__ = ("items",)
+
     def __init__(self) -> None:
         self.items: List[Diagnostic] = []
 
@@ -22,7 +24,11 @@ class Diagnostics:
         self.items.append(Diagnostic("note", code, message, pos))
 
     def extend(self, other: "Diagnostics") -> None:
-        self.items.extend(other.items)
+        self += other
+
+    def __iadd__(self, other: "Diagnostics") -> "Diagnostics":
+        self.items += other.items
+        return self
 
     def __iter__(self):
         return iter(self.items)
\ No newline at end of file
@@ -1,269 +1,142 @@
-from typing import Dict, Union, Optional, Any
-from dataclasses import dataclass
-from .args import bind_args
-from ginger.surface.funcs import SURFACE_FUNCS
-from .base.funcs import BASE_FUNCS
-from ginger.runtime.dispatch import Dispatcher
+from typing import Callable, List, Set, Tuple
 from .symbols_builder import build_symbols
-from .errors import EvalError, TypecheckError
-from ginger.runtime.failures import RaisedFailure, FailureId
-from .builtin import call_builtin
+from .errors import EvalError
+from .runtime.failures import RaisedFailure
+from .compile import Compiler, Env
 
 from .ast import (
-    SigDecl,
-    FuncDecl,
     VarDecl,
     AssignStmt,
-    Expr,
-    CallExpr,
-    PosArg,
-    NamedArg,
-    IdentExpr,
-    IntLit,
-    FloatLit,
-    BlockStmt,
-    ReturnStmt,
     ExprStmt,
-    TryStmt,
     CatchStmt,
-    RequireGuarantees,
+    TryBlock,
 )
+from .lower import program_blocks
+from .core.prelude import prelude_items
 
 
 # =====================
 # Runtime
 # =====================
-#Value = Union[int, float]
-Value = Any
+# 式は compile.Compiler でクロージャにしてから評価する（func 本文は syms ごとに一度だけ変換）
+# トップレベルの文も (env, mutable) -> None のクロージャにし、prog に保持して変換し直さない。
 
-@dataclass
-class Cell:
-    value: Value
-    mutable: bool   # let=False, var=True
+# トップレベルの文: (env, var で束縛された名前) -> None
+Step = Callable[[Env, Set[str]], None]
 
-@dataclass
-class ReturnSignal(Exception):
-    value: "Value"
+def eval_program(prog) -> Env:
 
-def eval_program(prog) -> Dict[str, Cell]:
-    
-    syms = build_symbols(prog)
-    env: Dict[str, Cell] = {}
+    env: Env = {}
+    mutable: set[str] = set()   # var で束縛された名前
 
-    i = 0
+    # 変換済みの文があればそれを使う（prelude が変わっていたら変換し直す）
+    prelude = prelude_items()
+    cached = prog.code
 
-    while i < len(prog.items):
+    if cached is not None and cached[0] is prelude:
+        steps = cached[1]
+    else:
+        steps = compile_program(prog)
+        prog.code = (prelude, steps)
 
-        item = prog.items[i]
-        
-        if isinstance(item, TryStmt):
-            # catchを連鎖で収集
-            j = i + 1
-            catches = []
+    for step in steps:
+        step(env, mutable)
 
-            while j < len(prog.items) and isinstance(prog.items[j], CatchStmt):
-                catches.append(prog.items[j])
-                j += 1
+    return env
 
-            if not catches:
-                raise EvalError("try must be followed by at least one catch")
-            
-            try:
-                # try本体（成功したら、catchは一切走らない）
-                eval_expr(item.expr, env=env, syms=syms, outer=None)
-            except RaisedFailure as rf:
-
-                handled = False
-
-                for c in catches:
-
-                    if rf.fid.value == c.failure_name:
-                        handled = True
-
-                        # ネスト禁止のため、catch内で同じ failure が起きたら握る
-                        try:
-                            eval_expr(c.expr, env=env, syms=syms)
-                        except RaisedFailure as rf2:
-                            if rf2.fid.value != c.failure_name:
-                                raise
-                        break
-                
-                if not handled:
-                    raise   # 一致する catch が無ければ外へ
-            
-            i = j
-            continue
-
-        # catch単体は実行時もエラーにしておく
-        if isinstance(item, CatchStmt):
-            raise EvalError("catch without preceding try")
-            
-        if isinstance(item, VarDecl):
-            v = eval_expr(item.expr, env=env, syms=syms)
-            env[item.name] = Cell(value=v, mutable=item.mutable)
-            i += 1
-            continue
-
-        if isinstance(item, AssignStmt):
-            if item.name not in env:
-                raise EvalError(f"unknown identifier '{item.name}'")
-            cell = env[item.name]
-            if not cell.mutable:
-                raise EvalError(f"cannot assign to immutable binding '{item.name}'")
-            v = eval_expr(item.expr, env=env, syms=syms)
-            env[item.name] = Cell(value=v, mutable=cell.mutable)
-            i += 1
-            continue
-
-        if isinstance(item, ExprStmt):
-            eval_expr(item.expr, env=env, syms=syms)
-            i += 1
-            continue
-
-        i += 1
+def compile_program(prog) -> Tuple[Step, ...]:
+    """prog をトップレベルの文ごとのクロージャにする。"""
 
-    return env
+    comp = Compiler(build_symbols(prog))
+    compilers = _TOPLEVEL_COMPILERS
+    steps: List[Step] = []
 
-def eval_expr(expr: Expr, env: Dict[str, Cell], syms, outer: Optional[Dict[str, Cell]] = None) -> Value:
-
-    if isinstance(expr, IntLit):
-        return int(expr.value)
-
-    if isinstance(expr, FloatLit):
-        return float(expr.value)
-
-    if isinstance(expr, IdentExpr):
-        if expr.name in env:
-            return env[expr.name].value
-        if outer is not None and expr.name in outer:
-            return outer[expr.name].value
-        raise EvalError(f"unknown identifier '{expr.name}'")
-
-    if isinstance(expr, CallExpr):
-        return eval_call(expr, env, syms, outer=outer)
-
-    raise EvalError(f"unsupported expr node: {expr!r}")
-
-def _runtime_type(v):
-    if isinstance(v, bool):
-        return "Bool"
-    if isinstance(v, int):
-        return "Int"
-    if isinstance(v, float):
-        return "Float"
-    if isinstance(v, str):
-        return "String"
-    if (isinstance(v, tuple) 
-        and len(v) == 2 
-        and v[0] == "Ordering"
-        and v[1] in ("Left", "Flat", "Right")):
-        return "Ordering"
-    if v is None:
-        return "Unit"
-    raise EvalError(f"unknown runtime value type: {type(v)}")
-
-def eval_user_func(fname: str, args: list[Value], syms, caller_env: Dict[str, Cell]) -> Value:
-    """
-    Run a user-defined func body.
-    - Parameters are bound positionally
-    - Locals are immutable (mutable stmt not implemented inside func yet).
-    - Global lookup is allowed via 'caller_env' as 'outer'.
-    - ReturnSignal carries the return value.
-    - If a RaisedFailure happens and the corresponding sig has @attr.handled, swallow it and return Unit(None).
-    """
-    if fname not in syms.funcs:
-        raise EvalError(f"unknown func '{fname}'")
-    
-    fdecl: FuncDecl = syms.funcs[fname]
-
-    if len(args) != len(fdecl.params):
-        raise EvalError(
-            f"argument count mismatch in call to {fname}: expected {len(fdecl.params)}, got {len(args)}"
-        )
-    
-    # local env: bind_parameters
-    local: Dict[str, Cell] = {}
-
-    for p,v in zip(fdecl.params, args):
-        local[p.name] = Cell(value=v, mutable=False)
-
-    try:
-        eval_block(fdecl.body, env=local, syms=syms, outer=caller_env)
-        return None     # implicit Unit
-    except ReturnSignal as rs:
-        return rs.value
-    except RaisedFailure:
-        # @attr.handled: swallow failures of this sig
-        attrs = syms.sig_attrs.get(fname, set())
-        if "handled" in attrs:
-            return None
-        raise
-
-
-def eval_call(expr: CallExpr, env: Dict[str, Cell], syms, outer: Optional[Dict[str, Cell]] = None):
-
-    # 引数評価
-    if expr.arg_style != "pos":
-        raise EvalError(f"named args not supported at runtime for '{expr.callee}'")
-    
-    args = [eval_expr(a.expr, env, syms, outer) for a in expr.args]
-
-    # user func があればそちらで対応（既存の仕様があれば維持）
-    if expr.callee in syms.funcs:
-        return eval_user_func(expr.callee, args, syms, env)
-    
-    # sig 呼び出しなら impl 経由で builtin に落とす
-    if expr.callee in syms.sigs:
-        
-        sig = syms.sigs[expr.callee]
-
-        # sig に builtin が直結していたら、それを呼ぶ（requires不要）
-        if getattr(sig, "builtin", None) is not None:
-            try:
-                return call_builtin(sig.builtin, *args)
-            except ZeroDivisionError:
-                raise RaisedFailure(FailureId.DivideByZero)
-
-        req_guars = [r for r in sig.requires if isinstance(r, RequireGuarantees)]
-
-        if len(req_guars) != 1:
-            raise EvalError(
-                f"sig '{sig.name}' must have exactly 1 'require T guarantees G' for runtime dispatch (got {len(req_guars)})"
-            )
-        
-        guar = req_guars[0].guarantee_name
-
-        # Self の具象型を引数から決める（四則は左右同型を想定）
-        if not args:
-            raise EvalError(f"sig '{sig.name}' needs args for runtime dispatch")
-        
-        t0 = _runtime_type(args[0])
-        key = (t0, guar, sig.name)      # (Type, Guarantee, Method)
-        builtin_id = syms.impls.get(key)
-
-        if builtin_id is None:
-            raise EvalError(f"no impl for {t0} guarantees {guar}.{sig.name}")
-        
-        # builtin 実行
+    for item in program_blocks(prog):
+        compile_item = compilers.get(type(item))
+        if compile_item is not None:
+            steps.append(compile_item(item, comp))
+
+    return tuple(steps)
+
+def _raise_step(message: str) -> Step:
+    # エラーは従来どおり、その文に達した時に送出する
+    def _step(env: Env, mutable: Set[str]) -> None:
+        raise EvalError(message)
+    return _step
+
+def _compile_try(item: TryBlock, comp: Compiler) -> Step:
+
+    if not item.catches:
+        return _raise_step("try must be followed by at least one catch")
+
+    body = comp.expr(item.try_stmt.expr)
+    # failure 名 -> catch の式
+    handlers = {name: comp.expr(c.expr) for name, c in item.catch_map.items()}
+
+    def _step(env: Env, mutable: Set[str]) -> None:
         try:
-            return call_builtin(builtin_id, *args)
-        except ZeroDivisionError:
-            raise RaisedFailure(FailureId.DivideByZero)
-    
-    raise EvalError(f"function '{expr.callee}' has no runtime implementation yet")
-    
-
-def eval_block(block: BlockStmt, env: Dict[str, Cell], syms, outer: Optional[Dict[str, Cell]] = None) -> None:
-        
-    for st in block.stmts:
-        # return
-        if isinstance(st, ReturnStmt):
-            v = eval_expr(st.expr, env=env, syms=syms, outer=outer)
-            raise ReturnSignal(v)
-        
-        # 今は ExprStmt のみ対応
-        if isinstance(st, ExprStmt):
-            eval_expr(st.expr, env=env, syms=syms, outer=outer)
-            continue
-
-        raise EvalError(f"unsupported statement in func body: {st!r}")
\ No newline at end of file
+            # try本体（成功したら、catchは一切走らない）
+            body(env, None)
+        except RaisedFailure as rf:
+
+            name = rf.fid.value
+            handler = handlers.get(name)
+
+            if handler is None:
+                raise   # 一致する catch が無ければ外へ
+
+            # ネスト禁止のため、catch内で同じ failure が起きたら握る
+            try:
+                handler(env, None)
+            except RaisedFailure as rf2:
+                if rf2.fid.value != name:
+                    raise
+
+    return _step
+
+def _compile_catch(item: CatchStmt, comp: Compiler) -> Step:
+    # catch単体は実行時もエラーにしておく
+    return _raise_step("catch without preceding try")
+
+def _compile_var_decl(item: VarDecl, comp: Compiler) -> Step:
+    name, is_mutable = item.name, item.mutable
+    code = comp.expr(item.expr)
+
+    def _step(env: Env, mutable: Set[str]) -> None:
+        env[name] = code(env, None)
+        # 同じ名前を let で束縛し直したら代入できなくする
+        if is_mutable:
+            mutable.add(name)
+        else:
+            mutable.discard(name)
+
+    return _step
+
+def _compile_assign(item: AssignStmt, comp: Compiler) -> Step:
+    name = item.name
+    code = comp.expr(item.expr)
+
+    def _step(env: Env, mutable: Set[str]) -> None:
+        if name not in env:
+            raise EvalError(f"unknown identifier '{name}'")
+        if name not in mutable:
+            raise EvalError(f"cannot assign to immutable binding '{name}'")
+        env[name] = code(env, None)
+
+    return _step
+
+def _compile_expr_stmt(item: ExprStmt, comp: Compiler) -> Step:
+    code = comp.expr(item.expr)
+
+    def _step(env: Env, mutable: Set[str]) -> None:
+        code(env, None)
+
+    return _step
+
+_TOPLEVEL_COMPILERS = {
+    TryBlock: _compile_try,
+    CatchStmt: _compile_catch,
+    VarDecl: _compile_var_decl,
+    AssignStmt: _compile_assign,
+    ExprStmt: _compile_expr_stmt,
+}
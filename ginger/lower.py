@@ -1,11 +1,11 @@
-from dataclasses import replace
-from typing import List
+from typing import List, Tuple
 
 from .ast import (
     Program, TopLevel,
-    ExprStmt, TryStmt, CatchStmt, VarDecl, AssignStmt,
+    ExprStmt, TryStmt, CatchStmt, TryBlock, VarDecl, AssignStmt,
     FuncDecl, BlockStmt, ReturnStmt,
-    Expr, BinaryExpr, CallExpr, PosArg,
+    Expr, BinaryExpr, CallExpr,
+    LEAF_EXPR_TYPES,
 )
 
 # op -> callee
@@ -20,7 +20,44 @@ def lower_program(prog: Program) -> Program:
     new_items: List[TopLevel] = []
     for it in prog.items:
         new_items.append(lower_toplevel(it))
-    return Program(items=new_items)
+    return Program(items=tuple(new_items))
+
+def program_blocks(prog: Program) -> list:
+    """
+    prog.items を、TryStmt + 後続の CatchStmt 群を TryBlock にまとめた並びで返す。
+    一度だけ作って prog に保持する。
+    catch の無い try や単独の catch はそのまま残す（エラーにするのは呼び出し側）。
+    """
+    blocks = prog.blocks
+    if blocks is None:
+        blocks = prog.blocks = group_try_blocks(prog.items)
+    return blocks
+
+def group_try_blocks(items: Tuple[TopLevel, ...]) -> list:
+
+    out = []
+    try_stmt = None     # catch を集めている途中の try
+    catches: List[CatchStmt] = []
+
+    for item in items:
+
+        if try_stmt is not None:
+            if isinstance(item, CatchStmt):
+                catches.append(item)
+                continue
+            out.append(TryBlock(try_stmt=try_stmt, catches=tuple(catches)))
+            try_stmt = None
+
+        if isinstance(item, TryStmt):
+            try_stmt, catches = item, []
+            continue
+
+        out.append(item)
+
+    if try_stmt is not None:
+        out.append(TryBlock(try_stmt=try_stmt, catches=tuple(catches)))
+
+    return out
 
 def lower_toplevel(it: TopLevel) -> TopLevel:
     
@@ -69,9 +106,13 @@ def lower_block(b: BlockStmt) -> BlockStmt:
         else:
             out.append(st)
     
-    return BlockStmt(stmts=out)
+    return BlockStmt(stmts=tuple(out))
 
 def lower_expr(e: Expr) -> Expr:
+
+    # IdentExpr / IntLit / FloatLit はそのまま（最も多いので先に返す）
+    if isinstance(e, LEAF_EXPR_TYPES):
+        return e
     
     if isinstance(e, BinaryExpr):
         
@@ -86,20 +127,18 @@ def lower_expr(e: Expr) -> Expr:
 
         return CallExpr(
             callee=callee,
-            args=[PosArg(left), PosArg(right)],
+            args=(left, right),
             arg_style="pos",
         )
     
     # CallExpr の引数も再帰的に lower（ネストした演算を潰す）
     if isinstance(e, CallExpr):
 
-        new_args = []
-
-        for a in e.args:
-            # PosArg / NamedArg どちらも中身は expr
-            new_args.append(replace(a, expr=lower_expr(a.expr)))
+        if e.arg_style == "named":
+            new_args = tuple((name, lower_expr(a)) for name, a in e.args)
+        else:
+            new_args = tuple(lower_expr(a) for a in e.args)
         
         return CallExpr(callee=e.callee, args=new_args, arg_style=e.arg_style)
-    
-    # IdentExpr / IntLit / FloatLit はそのまま
+
     return e
\ No newline at end of file
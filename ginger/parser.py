@@ -1,19 +1,27 @@
+from functools import lru_cache
 from typing import List, Optional, Tuple
 from .tokenizer import Token, tokenize
 from .ast import (
     Program, TopLevel,
-    TypeRef, Param, FuncSig,
+    TypeRef, type_ref, Param, FuncSig,
     GuaranteeDecl, TypeGroupDecl, RegisterDecl,
     ImplDecl, ImplMethod,
     RequireClause, RequireIn, RequireGuarantees,
     SigDecl, FuncDecl, VarDecl,AssignStmt,BinaryExpr,
     BlockStmt, ReturnStmt, Stmt,
     Expr, CallExpr, IdentExpr, IntLit, FloatLit,
-    Arg, PosArg, NamedArg,
+    Arg,
     ExprStmt, TryStmt, CatchStmt,
 )
 
-# 演算子の優先順位
+# IDENT の直後の記号 -> Parser.ident_follow に入れる値
+_CALL_START = 1      # IDENT '('
+_NAMED_ARG = 2       # IDENT ':'
+_ASSIGN_START = 3    # IDENT '='
+
+_IDENT_FOLLOW = {"(": _CALL_START, ":": _NAMED_ARG, "=": _ASSIGN_START}
+
+# 演算子の優先順位（0 は「演算子でない」に使うので 1 以上）
 _PRECEDENCE = {
     "+": 10,
     "-": 10,
@@ -26,10 +34,10 @@ class Parser:
     def __init__(self, toks: List[Token]):
         self.toks = toks
         self.i = 0
+        self.ident_follow, self.next_non_newline, self.op_prec = _lookahead(toks)
 
     def skip_newlines(self) -> None:
-        while self.match("NEWLINE"):
-            self.i += 1
+        self.i = self.next_non_newline[self.i]
 
     def cur(self) -> Token:
         return self.toks[self.i]
@@ -45,13 +53,21 @@ class Parser:
 
     def eat(self, kind: str, text: Optional[str] = None) -> Token:
 
-        t = self.cur()
-        if not self.match(kind, text):
+        t = self.toks[self.i]
+        if t.kind != kind or (text is not None and t.text != text):
             exp = f"{kind}('{text}')" if text else kind
             raise SyntaxError(f"Expected {exp} but got {t.kind}('{t.text}') at {t.pos}")
         self.i += 1
         return t
     
+    def _eat_sym(self, text: str) -> None:
+        # 記号用の eat（成功時はトークンを返さない）
+        t = self.toks[self.i]
+        if t.kind == "SYM" and t.text == text:
+            self.i += 1
+            return
+        raise SyntaxError(f"Expected SYM('{text}') but got {t.kind}('{t.text}') at {t.pos}")
+    
     def parse_attrs(self) -> List[str]:
         """
         Parse attribute lines preceding a func declaration.
@@ -75,7 +91,7 @@ class Parser:
                 )
             """
             
-            self.eat("SYM", "@")
+            self._eat_sym("@")
 
             # must be: attr . NAME
             ns = self.eat("IDENT").text
@@ -90,7 +106,7 @@ class Parser:
                     f"expected '.' after '@attr' (use @attr.<name>), got {t.kind}('{t.text}') at {t.pos}"
                 )
 
-            self.eat("SYM", ".")
+            self._eat_sym(".")
 
             if not self.match("IDENT"):
                 t = self.cur()
@@ -109,17 +125,18 @@ class Parser:
     def parse_program(self) -> Program:
 
         items: List[TopLevel] = []
+        toks = self.toks
+        skip = self.next_non_newline
         while True:
             # 空行はここで全部捨てる(toplevelに入る前)
-            while self.match("NEWLINE"):
-                self.i += 1
+            i = self.i = skip[self.i]
 
-            if self.match("EOF"):
+            if toks[i].kind == "EOF":
                 break
 
             items.append(self.parse_toplevel())
 
-        return Program(items)
+        return Program(tuple(items))
 
     def parse_toplevel(self) -> TopLevel:
         
@@ -129,31 +146,45 @@ class Parser:
         
         # 先頭の @attr を回収
         attrs = self.parse_attrs()
+
+        t = self.toks[self.i]
         
         # --- catalog/decl ---
-        if self.match("KW", "guarantee"):
-            return self.parse_guarantee()
-        if self.match("KW", "typegroup"):
-            return self.parse_typegroup()
-        if self.match("KW", "register"):
-            return self.parse_register()
-        if self.match("KW", "impl"):
-            return self.parse_impl()
-        if self.match("KW", "func"):
-            return self.parse_func(attrs=attrs)
-        if self.match("KW", "sig"):
-            return self.parse_sig(attrs=attrs)
+        if t.kind == "KW":
+            decl = _TOPLEVEL_DECLS.get(t.text)
+            if decl is not None:
+                return decl(self, attrs)
         
         # attrs があるのに func でない場合：エラー
         if attrs:
             raise SyntaxError("attributes must precede a sig or func declaration")
         
-        # --- let/var (toplevel statement) ---
-        if self.match("KW", "let"):
-            return self.parse_let_var_decl(mutable=False)
-        if self.match("KW", "var"):
-            return self.parse_let_var_decl(mutable=True)
+        # --- let/var, try/catch (toplevel statement) ---
+        if t.kind == "KW":
+            stmt = _TOPLEVEL_STMTS.get(t.text)
+            if stmt is not None:
+                return stmt(self)
+
+        follow = self.ident_follow[self.i]
+
+        # --- AssignStmt ---
+        if follow == _ASSIGN_START:
+            return self.parse_assign_stmt()
+
+        # --- ExprStmt ---
+        if follow == _CALL_START:
+            expr = self.parse_expr()
+            return ExprStmt(expr=expr)
         
+        raise SyntaxError(f"Unexpected toplevel token {t.kind}('{t.text}') at {t.pos}")
+    
+
+    def parse_try_stmt(self) -> TryStmt:
+        self.eat("KW", "try")
+        expr = self.parse_expr()
+        return TryStmt(expr=expr)
+
+    def parse_catch_stmt(self) -> CatchStmt:
         """
         try print(1) 
         catch PrintErr try print(0) 
@@ -161,104 +192,88 @@ class Parser:
         
         のような構文を禁止する 
         """
+        self.eat("KW", "catch")
         
-        # --- try/catch (toplevel statement) ---
-        if self.match("KW", "try"):
-
-            self.i += 1
-            expr = self.parse_expr()
-            return TryStmt(expr=expr)
-        
-        if self.match("KW", "catch"):
-
-            self.i += 1
-            
-            if not self.match("IDENT"):
-                raise SyntaxError("expected failure name after catch")
-            
-            failure_name = self.toks[self.i].text
-            self.i += 1
-
-            handler_tokens = []
-
-            while not self.match("NEWLINE") and not self.match("EOF"):
-                handler_tokens.append(self.toks[self.i])
-                self.i += 1
-            
-            if self.match("NEWLINE"):
-                self.i += 1
-
-            if not handler_tokens:
-                raise SyntaxError("catch must have a handler expression on the same line")
-            
-            # ネスト禁止：handlerの先頭が try/catch ならアウト
-            if handler_tokens[0].kind == "KW" and handler_tokens[0].text in ("try", "catch"):
-                raise SyntaxError("nested try/catch is forbidden in catch body")
-            
-            sub = Parser(handler_tokens + [Token("EOF", "", handler_tokens[-1].pos)])
-            expr = sub.parse_expr()
-
-            return CatchStmt(failure_name=failure_name, expr=expr)
+        if not self.match("IDENT"):
+            raise SyntaxError("expected failure name after catch")
         
-        # --- AssignStmt ---
-        if (self.match("IDENT") and self.toks[self.i + 1].kind == "SYM" and self.toks[self.i + 1].text == "="):
-            return self.parse_assign_stmt()
+        toks = self.toks
+        failure_name = toks[self.i].text
+        start = self.i + 1
+
+        # ネスト禁止：handlerの先頭が try/catch ならアウト（行末を探す前に弾く）
+        head = toks[start]
+        if head.kind == "KW" and head.text in _TRY_CATCH:
+            raise SyntaxError("nested try/catch is forbidden in catch body")
+
+        # handler は同じ行の終わり（NEWLINE / EOF）まで
+        end = start
+        while toks[end].kind != "NEWLINE" and toks[end].kind != "EOF":
+            end += 1
+
+        if end == start:
+            raise SyntaxError("catch must have a handler expression on the same line")
         
-        # --- ExprStmt ---
-        if self.match("IDENT") and self.toks[self.i + 1].kind == "SYM" and self.toks[self.i + 1].text == "(":
+        # 別の Parser は作らず、行末を一時的に EOF にしてその場で読む
+        boundary = toks[end]
+        toks[end] = Token("EOF", "", toks[end - 1].pos)
+        self.i = start
+        try:
             expr = self.parse_expr()
-            return ExprStmt(expr=expr)
-        
-        t = self.cur()
-        raise SyntaxError(f"Unexpected toplevel token {t.kind}('{t.text}') at {t.pos}")
-    
+        finally:
+            toks[end] = boundary
+
+        # 行末の後ろから再開（handler の読み残しは従来どおり捨てる）
+        self.i = end + 1 if boundary.kind == "NEWLINE" else end
+
+        return CatchStmt(failure_name=failure_name, expr=expr)
 
     # ---- shared ----
     def parse_dotted_name(self) -> str:
         # IDENT ('.' IDENT)*
-        name = self.eat("IDENT").text
+        parts = [self.eat("IDENT").text]
         while self.match("SYM", "."):
-            self.eat("SYM", ".")
-            name += "." + self.eat("IDENT").text
-        return name
+            self.i += 1
+            parts.append(self.eat("IDENT").text)
+        return ".".join(parts)
 
     def parse_type(self) -> TypeRef:
-        return TypeRef(self.eat("IDENT").text)
+        return type_ref(self.eat("IDENT").text)
 
-    def parse_params(self) -> List[Param]:
+    def parse_params(self) -> Tuple[Param, ...]:
 
-        params: List[Param] = []
         if self.match("SYM", ")"):
-            return params
+            return ()
+        params: List[Param] = []
         while True:
             pname = self.eat("IDENT").text
-            self.eat("SYM", ":")
+            self._eat_sym(":")
             ptype = self.parse_type()
             params.append(Param(pname, ptype))
             if self.match("SYM", ","):
-                self.eat("SYM", ",")
+                self._eat_sym(",")
                 continue
             break
-        return params
+        return tuple(params)
     
-    def parse_sig_param_types(self) -> List[TypeRef]:
+    def parse_sig_param_types(self) -> Tuple[TypeRef, ...]:
         
-        tys: List[TypeRef] = []
-
         if self.match("SYM", ")"):
-            return tys
+            return ()
+
+        tys: List[TypeRef] = []
         
         while True:
 
             tys.append(self.parse_type())   # IDENT -> TypeRef
 
             if self.match("SYM", ","):
-                self.eat("SYM", ",")
+                self._eat_sym(",")
                 continue
 
             break
 
-        return tys
+        return tuple(tys)
 
     # ---- guarantee ----
 
@@ -266,7 +281,7 @@ class Parser:
 
         self.eat("KW", "guarantee")
         name = self.eat("IDENT").text
-        self.eat("SYM", "{")
+        self._eat_sym("{")
         methods: List[FuncSig] = []
 
         while True:
@@ -275,16 +290,16 @@ class Parser:
                 break
             methods.append(self.parse_method_sig())
 
-        self.eat("SYM", "}")
-        return GuaranteeDecl(name=name, methods=methods)
+        self._eat_sym("}")
+        return GuaranteeDecl(name=name, methods=tuple(methods))
 
     def parse_method_sig(self) -> FuncSig:
         # add(self: Self, other: Self) -> Self
         fname = self.eat("IDENT").text
-        self.eat("SYM", "(")
+        self._eat_sym("(")
         params = self.parse_params()
-        self.eat("SYM", ")")
-        self.eat("SYM", "->")
+        self._eat_sym(")")
+        self._eat_sym("->")
         ret = self.parse_type()
         return FuncSig(name=fname, params=params, ret=ret)
 
@@ -294,12 +309,12 @@ class Parser:
         # typegroup Number = Int | Float
         self.eat("KW", "typegroup")
         name = self.eat("IDENT").text
-        self.eat("SYM", "=")
+        self._eat_sym("=")
         members: List[TypeRef] = [self.parse_type()]
         while self.match("SYM", "|"):
-            self.eat("SYM", "|")
+            self._eat_sym("|")
             members.append(self.parse_type())
-        return TypeGroupDecl(name=name, members=members)
+        return TypeGroupDecl(name=name, members=tuple(members))
 
     # ---- register ----
 
@@ -320,7 +335,7 @@ class Parser:
         self.eat("KW", "guarantees")
         gname = self.eat("IDENT").text
 
-        self.eat("SYM", "{")
+        self._eat_sym("{")
         methods: List[ImplMethod] = []
 
         while True:
@@ -329,13 +344,13 @@ class Parser:
                 break
 
             mname = self.eat("IDENT").text
-            self.eat("SYM", "=")
+            self._eat_sym("=")
             self.eat("KW", "builtin")
             bname = self.parse_dotted_name()
             methods.append(ImplMethod(name=mname, builtin=bname))
 
-        self.eat("SYM", "}")
-        return ImplDecl(typ=typ, guarantee=gname, methods=methods)
+        self._eat_sym("}")
+        return ImplDecl(typ=typ, guarantee=gname, methods=tuple(methods))
     
 
     # ---- sig ----
@@ -344,17 +359,17 @@ class Parser:
 
         self.eat("KW", "sig")
         name = self.eat("IDENT").text
-        self.eat("SYM", "(")
+        self._eat_sym("(")
         params = self.parse_sig_param_types()
-        self.eat("SYM", ")")
-        self.eat("SYM", "->")
+        self._eat_sym(")")
+        self._eat_sym("->")
         ret = self.parse_type()
 
         requires: List[RequireClause] = []
         failures: list[str] = []
         builtin: str | None = None
 
-        self.eat("SYM", "{")
+        self._eat_sym("{")
 
         while True:
 
@@ -395,15 +410,15 @@ class Parser:
             t = self.cur()
             raise SyntaxError(f"Unexpected token in sig body {t.kind}('{t.text}') at {t.pos}")
 
-        self.eat("SYM", "}")
+        self._eat_sym("}")
 
         return SigDecl(
             name=name,
             params=params,
             ret=ret,
-            requires=requires,
-            failures=failures,
-            attrs=list(attrs or []),
+            requires=tuple(requires),
+            failures=tuple(failures),
+            attrs=tuple(attrs or ()),
             builtin=builtin,
         )
 
@@ -413,9 +428,9 @@ class Parser:
         # func add(a: Int, b: Int) { return a + b }
         self.eat("KW", "func")
         name = self.eat("IDENT").text
-        self.eat("SYM", "(")
+        self._eat_sym("(")
         params = self.parse_params()
-        self.eat("SYM", ")")
+        self._eat_sym(")")
         self.skip_newlines()
         body = self.parse_block()
 
@@ -423,27 +438,22 @@ class Parser:
             name=name, 
             params=params,
             body=body, 
-            attrs=list(attrs or []),
+            attrs=tuple(attrs or ()),
             )
 
     def parse_require_clause(self) -> RequireClause:
         self.eat("KW", "require")
         tvar = self.eat("IDENT").text
 
-        if self.match("KW", "in"):
-            self.eat("KW", "in")
-            group = self.eat("IDENT").text
-            return RequireIn(type_var=tvar, group_name=group)
-
-        if self.match("KW", "guarantees"):
-            self.eat("KW", "guarantees")
-            gname = self.eat("IDENT").text
-            return RequireGuarantees(type_var=tvar, guarantee_name=gname)
-
-        t = self.cur()
-        raise SyntaxError(
-            f"Expected 'in' or 'guarantees' after require, got {t.kind}('{t.text}') at {t.pos}"
-        )
+        # require T in G / require T guarantees G（どちらも (型変数, 名前) の組）
+        t = self.toks[self.i]
+        clause = _REQUIRE_CLAUSES.get(t.text) if t.kind == "KW" else None
+        if clause is None:
+            raise SyntaxError(
+                f"Expected 'in' or 'guarantees' after require, got {t.kind}('{t.text}') at {t.pos}"
+            )
+        self.i += 1
+        return clause(tvar, self.eat("IDENT").text)
 
     # ---- let/var decl ----
     def parse_let_var_decl(self, mutable: bool) -> VarDecl:
@@ -454,53 +464,49 @@ class Parser:
             self.eat("KW", "let")
 
         name = self.eat("IDENT").text
-        self.eat("SYM", ":")
+        self._eat_sym(":")
         typ = self.parse_type()
-        self.eat("SYM", "=")
+        self._eat_sym("=")
         expr = self.parse_expr()
 
         return VarDecl(mutable=mutable, typ=typ, name=name, expr=expr)
 
     def parse_assign_stmt(self) -> AssignStmt:
         name = self.eat("IDENT").text
-        self.eat("SYM", "=")
+        self._eat_sym("=")
         expr = self.parse_expr()
         return AssignStmt(name=name, expr=expr)
     
     def parse_block(self) -> BlockStmt:
 
-        self.eat("SYM", "{")
+        self._eat_sym("{")
         stmts: List[Stmt] = []
+        toks = self.toks
+        skip = self.next_non_newline
 
         while True:
 
-            self.skip_newlines()
+            i = self.i = skip[self.i]
+            t = toks[i]
 
-            if self.match("SYM", "}"):
+            if t.kind == "SYM" and t.text == "}":
                 break
 
-            # return <expr>
-            if self.match("KW", "return"):
-                self.eat("KW", "return")
-                expr = self.parse_expr()
-                stmts.append(ReturnStmt(expr=expr))
-                self.skip_newlines()
-                continue
-
-            # 今は最低限、式分だけ許可
-            expr = self.parse_expr()
-            stmts.append(ExprStmt(expr=expr))
-            self.skip_newlines()
+            # return <expr>。それ以外は今は最低限、式文だけ許可
+            stmt = _BLOCK_STMTS.get(t.text, ExprStmt) if t.kind == "KW" else ExprStmt
+            if stmt is not ExprStmt:
+                self.i += 1
+            stmts.append(stmt(expr=self.parse_expr()))
 
-        self.eat("SYM", "}")
+        self._eat_sym("}")
 
-        return BlockStmt(stmts=stmts)
+        return BlockStmt(stmts=tuple(stmts))
     
 
     # ---- expressions ----
 
     def _is_op(self) -> bool:
-        return self.match("SYM") and self.cur().text in _PRECEDENCE
+        return self.op_prec[self.i] != 0
 
     def parse_expr(self) -> Expr:
         # 演算子式は必ず '(' から始まる
@@ -524,7 +530,7 @@ class Parser:
 
         expr, saw_op = self.parse_infix(min_prec=0)
 
-        self.eat("SYM", ")")
+        self._eat_sym(")")
 
         if not saw_op:
             # (1) や (div(1,2)) を禁止
@@ -535,141 +541,172 @@ class Parser:
         return expr
 
     def parse_infix(self, min_prec: int) -> tuple[Expr, bool]:
-        # left operand
-        left = self.parse_operand()
+        # 再帰せず、演算子と operand のスタックで組み立てる（左結合）
+        toks = self.toks
+        op_prec = self.op_prec
+        operands: List[Expr] = [self.parse_operand()]
+        ops: List[str] = []
+        precs: List[int] = []
         saw_op = False
 
-        while self._is_op():
-            op = self.cur().text
-            prec = _PRECEDENCE[op]
-            if prec < min_prec:
+        while True:
+            prec = op_prec[self.i]
+            if not prec or prec < min_prec:
                 break
 
-            self.eat("SYM", op)
-            right, right_saw = self.parse_infix(min_prec=prec + 1)
+            # 優先順位が同じか高い演算子を先に畳む
+            while precs and precs[-1] >= prec:
+                precs.pop()
+                right = operands.pop()
+                operands[-1] = BinaryExpr(op=ops.pop(), left=operands[-1], right=right)
 
-            saw_op = True or saw_op
-            saw_op = saw_op or right_saw
+            ops.append(toks[self.i].text)
+            precs.append(prec)
+            saw_op = True
+            self.i += 1
+            operands.append(self.parse_operand())
 
-            left = BinaryExpr(op=op, left=left, right=right)
+        while ops:
+            right = operands.pop()
+            operands[-1] = BinaryExpr(op=ops.pop(), left=operands[-1], right=right)
 
-        return left, saw_op
+        return operands[0], saw_op
 
     def parse_operand(self) -> Expr:
-        
-        # unary '-' はどこでも禁止（neg(x)に固定）
-        if self.match("SYM", "-"):
-            t = self.cur()
-            raise SyntaxError(f"unary '-' is forbidden; use neg(x) at {t.pos}")
-
-        # infix-group は operand 扱いできる（入れ子OK）
-        if self.match("SYM", "("):
-            return self.parse_paren_infix_expr()
-
-        if self.match("IDENT"):
-            ident = self.eat("IDENT").text
-            if self.match("SYM", "("):
-                self.eat("SYM", "(")
+        # 先頭トークンの kind で一度だけ振り分ける
+        toks = self.toks
+        t = toks[self.i]
+        kind = t.kind
+
+        if kind == "IDENT":
+            if self.ident_follow[self.i] == _CALL_START:
+                self.i += 2
                 args, style = self.parse_args()
-                self.eat("SYM", ")")
-                return CallExpr(callee=ident, args=args, arg_style=style)
-            return IdentExpr(ident)
-
-        if self.match("INT"):
-            return IntLit(int(self.eat("INT").text))
-        if self.match("FLOAT"):
-            return FloatLit(float(self.eat("FLOAT").text))
-
-        t = self.cur()
-        raise SyntaxError(f"Unexpected token {t.kind}('{t.text}') at {t.pos} in expression")
-
-
-    def parse_primary(self) -> Expr:
-
-        if self.match("SYM", "-"):
-            
-            t = self.cur()
-
-            def tok(i):
-                if 0 <= i < len(self.toks):
-                    return self.toks[i]
-                return None
-            
-            t_m1 = tok(self.i - 1)
-            t_m2 = tok(self.i - 2)
+                self._eat_sym(")")
+                return CallExpr(callee=t.text, args=args, arg_style=style)
+            self.i += 1
+            return _ident_expr(t.text)
 
-            if (
-                t_m1 is not None and t_m1.kind == "SYM" and t_m1.text == "(" and
-                t_m2 is not None and t_m2.kind == "IDENT" and t_m2.text == "neg"
-            ):
-                raise SyntaxError(
-                    f"unary '-' is forbidden inside neg(...); write neg(neg(x)) instead at {t.pos}"
-                )
-            
-            raise SyntaxError(
-                f"unary '-' is forbidden; use neg(x) at {t.pos}"
-            )
+        if kind == "INT":
+            self.i += 1
+            return _int_lit(t.text)
+        if kind == "FLOAT":
+            self.i += 1
+            return _float_lit(t.text)
 
-        if self.match("IDENT"):
+        if kind == "SYM":
+            # unary '-' はどこでも禁止（neg(x)に固定）
+            if t.text == "-":
+                raise SyntaxError(f"unary '-' is forbidden; use neg(x) at {t.pos}")
 
-            ident = self.eat("IDENT").text
+            # infix-group は operand 扱いできる（入れ子OK）
+            if t.text == "(":
+                return self.parse_paren_infix_expr()
 
-            if self.match("SYM", "("):
-                self.eat("SYM", "(")
-                args, style = self.parse_args()
-                self.eat("SYM", ")")
-                return CallExpr(callee=ident, args=args, arg_style=style)
-            
-            return IdentExpr(ident)
-        
-        if self.match("INT"):
-            return IntLit(int(self.eat("INT").text))
-        if self.match("FLOAT"):
-            return FloatLit(float(self.eat("FLOAT").text))
-        
-        t = self.cur()
         raise SyntaxError(f"Unexpected token {t.kind}('{t.text}') at {t.pos} in expression")
 
-    def parse_args(self) -> Tuple[List[Arg], str]:
+
+    def parse_args(self) -> Tuple[Tuple[Arg, ...], str]:
         # empty ok
         if self.match("SYM", ")"):
-            return [], "pos"
+            return (), "pos"
+
+        toks = self.toks
+        follow = self.ident_follow
 
+        # named iff IDENT ':' at arg start（先頭の引数で style が決まる）
+        named = follow[self.i] == _NAMED_ARG
         args: List[Arg] = []
-        style: Optional[str] = None  # "pos" | "named"
 
         while True:
-            # named iff IDENT ':' at arg start
-            if (
-                self.match("IDENT")
-                and self.toks[self.i + 1].kind == "SYM"
-                and self.toks[self.i + 1].text == ":"
-            ):
-                if style is None:
-                    style = "named"
-                elif style != "named":
-                    raise SyntaxError("Cannot mix positional and named arguments")
-
-                name = self.eat("IDENT").text
-                self.eat("SYM", ":")
-                expr = self.parse_expr()
-                args.append(NamedArg(name=name, expr=expr))
-            else:
-                if style is None:
-                    style = "pos"
-                elif style != "pos":
-                    raise SyntaxError("Cannot mix positional and named arguments")
+            if (follow[self.i] == _NAMED_ARG) is not named:
+                raise SyntaxError("Cannot mix positional and named arguments")
 
-                expr = self.parse_expr()
-                args.append(PosArg(expr=expr))
+            if named:
+                name = toks[self.i].text
+                self.i += 2     # IDENT ':'
+                args.append((name, self.parse_expr()))
+            else:
+                args.append(self.parse_expr())
 
-            if self.match("SYM", ","):
-                self.eat("SYM", ",")
+            t = toks[self.i]
+            if t.kind == "SYM" and t.text == ",":
+                self.i += 1
                 continue
             break
 
-        return args, style or "pos"
+        return tuple(args), "named" if named else "pos"
     
 
+# func 本文の先頭キーワード -> 文のノード（キーワードの後に式が一つ続くもの）
+_BLOCK_STMTS = {
+    "return": ReturnStmt,
+}
+
+# require の後のキーワード -> 節のノード
+_REQUIRE_CLAUSES = {
+    "in": RequireIn,
+    "guarantees": RequireGuarantees,
+}
+
+_TRY_CATCH = frozenset(("try", "catch"))
+
+# toplevel の先頭キーワード -> 解析メソッド
+_TOPLEVEL_DECLS = {
+    "guarantee": lambda p, attrs: p.parse_guarantee(),
+    "typegroup": lambda p, attrs: p.parse_typegroup(),
+    "register": lambda p, attrs: p.parse_register(),
+    "impl": lambda p, attrs: p.parse_impl(),
+    "func": lambda p, attrs: p.parse_func(attrs=attrs),
+    "sig": lambda p, attrs: p.parse_sig(attrs=attrs),
+}
+
+_TOPLEVEL_STMTS = {
+    "let": lambda p: p.parse_let_var_decl(mutable=False),
+    "var": lambda p: p.parse_let_var_decl(mutable=True),
+    "try": Parser.parse_try_stmt,
+    "catch": Parser.parse_catch_stmt,
+}
+
+# 葉ノード（リテラル・識別子）は中身を書き換えないので、同じ綴りなら同じノードを使い回す
+@lru_cache(maxsize=1024)
+def _int_lit(text: str) -> IntLit:
+    return IntLit(int(text))
+
+@lru_cache(maxsize=1024)
+def _float_lit(text: str) -> FloatLit:
+    return FloatLit(float(text))
+
+@lru_cache(maxsize=1024)
+def _ident_expr(name: str) -> IdentExpr:
+    return IdentExpr(name)
+
+def _lookahead(toks: List[Token]) -> Tuple[bytearray, List[int], bytearray]:
+    """
+    トークン列を後ろから一度だけ走査して、先読み用の表を作る。
+    - follow[i]: IDENT の直後が '(' / ':' / '=' なら _CALL_START などの印
+    - skip[i]: i から見て最初の NEWLINE でないトークンの添字（末尾の EOF で必ず止まる）
+    - op_prec[i]: 演算子の SYM なら優先順位、それ以外は 0
+    """
+    n = len(toks)
+    follow = bytearray(n)
+    skip = list(range(n))
+    op_prec = bytearray(n)
+    get = _IDENT_FOLLOW.get
+    prec = _PRECEDENCE.get
+    nxt = toks[-1]
+    for i in range(n - 2, -1, -1):
+        t = toks[i]
+        kind = t.kind
+        if kind == "NEWLINE":
+            skip[i] = skip[i + 1]
+        elif kind == "IDENT":
+            if nxt.kind == "SYM":
+                follow[i] = get(nxt.text, 0)
+        elif kind == "SYM":
+            op_prec[i] = prec(t.text, 0)
+        nxt = t
+    return follow, skip, op_prec
+
 def parse(src: str) -> Program:
     return Parser(tokenize(src)).parse_program()
\ No newline at end of file
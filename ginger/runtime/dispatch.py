@@ -1,13 +1,19 @@
-from ginger.builtin import call_builtin, has_builtin
-from ginger.errors import EvalError
+from ..errors import EvalError
 
-def type_of(v):
+# type(v) -> Ginger の型名（bool は int の部分型なので従来どおり Int 扱い）
+_TYPE_OF = {
+    int: "Int",
+    bool: "Int",
+    float: "Float",
+    str: "String",
+    type(None): "Unit",
+}
 
-    if isinstance(v, int): return "Int"
-    if isinstance(v, float): return "Float"
-    if isinstance(v, str): return "String"
-    if v is None: return "Unit"
-    raise EvalError(f"unknown runtime value type: {type(v)}")
+def type_of(v):
+    t = _TYPE_OF.get(type(v))
+    if t is None:
+        raise EvalError(f"unknown runtime value type: {type(v)}")
+    return t
 
 class Dispatcher:
 
@@ -17,16 +23,14 @@ class Dispatcher:
     def call_impl_method(self, typ: str, guarantee: str, method: str, *args):
         
         key = (typ, guarantee, method)
-        
-        if key not in self.syms.impls:
-            raise EvalError(f"missing impl: {typ} guarantees {guarantee}.{method}")
-        
-        builtin_id = self.syms.impls[key]
+        fn = self.syms.impl_fns.get(key)
 
-        if not has_builtin(builtin_id):
-            raise EvalError(f"unknown builtin '{builtin_id}'")
+        if fn is None:
+            if key not in self.syms.impls:
+                raise EvalError(f"missing impl: {typ} guarantees {guarantee}.{method}")
+            raise EvalError(f"unknown builtin '{self.syms.impls[key]}'")
         
-        return call_builtin(builtin_id, *args)
+        return fn(*args)
     
     def type_of(self, v):
         return type_of(v)
\ No newline at end of file
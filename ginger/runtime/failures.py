@@ -1,6 +1,10 @@
-from dataclasses import dataclass
-from ginger.core.failure_spec import FailureId
+from ..core.failure_spec import FailureId
 
-@dataclass(frozen=True)
 class RaisedFailure(Exception):
-    fid: FailureId
\ No newline at end of file
+    """Ginger の failure を運ぶ例外（dataclass にせず、生成を軽くする）"""
+
+    def __init__(self, fid: FailureId) -> None:
+        self.fid = fid
+
+    def __repr__(self) -> str:
+        return f"RaisedFailure(fid={self.fid!r})"
@@ -1,6 +1,6 @@
-from ginger.errors import EvalError
-from ginger.runtime.failures import RaisedFailure
-from ginger.core.failure_spec import FailureId
+from ..errors import EvalError
+from ..runtime.failures import RaisedFailure
+from ..core.failure_spec import FailureId
 
 def print(args, dispatch):
 
@@ -10,7 +10,9 @@ def print(args, dispatch):
     
     # 引数：1個（2個以上ある場合は先頭のみ採用）
     v = args[0]
-    typ = dispatch.type_of(v) if hasattr(dispatch, "type_of") else None
+    # type_of を持たない dispatch もあるので、一度の getattr で引く
+    type_of = getattr(dispatch, "type_of", None)
+    typ = type_of(v) if type_of is not None else None
 
     try:
         return dispatch.call_impl_method(typ, "Printable", "print", v)
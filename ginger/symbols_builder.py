@@ -1,11 +1,11 @@
 from dataclasses import dataclass
 from typing import Dict, Tuple
 from collections import Counter
-from .builtin import BUILTINS
+from .builtin import BUILTINS, BuiltinFn
 from .errors import TypecheckError
-from ginger.core.failure_spec import FailureId, failures, EMPTY_FAILURES, FailureSet
+from .core.failure_spec import FailureId, failures, EMPTY_FAILURES, FailureSet
 from .attrs import is_defined, get_attr
-from ginger.core.prelude import prelude_items
+from .core.prelude import prelude_items
 
 from .ast import (
     Program,
@@ -23,7 +23,7 @@ from .ast import (
 # Symbols
 # =====================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Symbols:
 
     guarantees: Dict[str, GuaranteeDecl]
@@ -32,8 +32,10 @@ class Symbols:
     sigs: Dict[str, SigDecl]
     sig_failures: Dict[str, FailureSet]
     sig_attrs: Dict[str, set[str]]
+    handled: frozenset[str]                          # @attr.handled の付いた sig 名
     funcs: Dict[str, FuncDecl]                       # name -> decl
     impls: Dict[Tuple[str, str, str], str]           # (Type, Guarantee, Method) -> builtin_id
+    impl_fns: Dict[Tuple[str, str, str], BuiltinFn]  # (Type, Guarantee, Method) -> builtin 関数（解決済み）
     types: set[str]                                  # プリミティブ型
 
 
@@ -58,10 +60,10 @@ def build_symbols(prog: Program) -> Symbols:
     sig_attrs: Dict[str, set[str]] = {}
     funcs: Dict[str, FuncDecl] = {}
     impls: Dict[Tuple[str, str, str], str] = {}
+    impl_fns: Dict[Tuple[str, str, str], BuiltinFn] = {}
     types: set[str] = set()
 
-    items = prelude_items()
-    items += list(prog.items)
+    items = [*prelude_items(), *prog.items]
 
     for item in items:
 
@@ -215,6 +217,9 @@ def build_symbols(prog: Program) -> Symbols:
                         f"duplicate impl for type '{t}', guarantee '{g}', method '{m.name}'"
                     )
                 impls[key] = m.builtin
+                fn = BUILTINS.get(m.builtin)
+                if fn is not None:
+                    impl_fns[key] = fn
             
             # implされた型も存在
             types.add(t)
@@ -229,8 +234,10 @@ def build_symbols(prog: Program) -> Symbols:
         sigs=sigs,
         sig_failures=sig_failures,
         sig_attrs=sig_attrs,
+        handled=frozenset(n for n, a in sig_attrs.items() if "handled" in a),
         funcs=funcs,
         impls=impls,
+        impl_fns=impl_fns,
         types=types,
     )
 
@@ -1,7 +1,9 @@
+import sys
 from dataclasses import dataclass
 from typing import List
 
-@dataclass(frozen=True)
+# slots=True で属性参照を軽くする。frozen で不変・hash 可能に保つ
+@dataclass(frozen=True, slots=True)
 class Token:
     kind: str   # KW, IDENT, SYM, INT, FLOAT, EOF, NEWLINE
     text: str
@@ -19,6 +21,14 @@ KEYWORDS = {
 SYMBOLS_1 = set("{}():,=@.+-*/")  # one-char
 # special: "->" and "|"
 
+# KW の text は intern 済みの同じ文字列を使う（src の切り出しを Token ごとに持たない。
+# dict のキーとして引く時も同一性で当たる）。
+# 1 文字の SYM は src[i] が元から共有の文字列、"->" と "|" は定数なのでそのまま。
+_KW_TEXT = {k: sys.intern(k) for k in KEYWORDS}
+
+# IDENT も intern する（env / syms の dict を引く時に同一性で当たり、同じ名前は一つの文字列になる）
+_intern = sys.intern
+
 def tokenize(src: str) -> List[Token]:
 
     toks: List[Token] = []
@@ -99,8 +109,11 @@ def tokenize(src: str) -> List[Token]:
             while peek().isalnum() or peek() in "_":
                 i += 1
             text = src[start:i]
-            kind = "KW" if text in KEYWORDS else "IDENT"
-            toks.append(Token(kind, text, start))
+            kw = _KW_TEXT.get(text)
+            if kw is not None:
+                toks.append(Token("KW", kw, start))
+            else:
+                toks.append(Token("IDENT", _intern(text), start))
             continue
 
         raise SyntaxError(f"Unexpected character '{c}' at {i}")
@@ -2,8 +2,9 @@ from dataclasses import dataclass
 from typing import Dict, Optional
 from .errors import TypecheckError
 from .symbols_builder import build_symbols
-from ginger.core.failure_spec import failures, FailureId, FailureSet, EMPTY_FAILURES, union_failures
+from .core.failure_spec import failures, FailureId, FailureSet, EMPTY_FAILURES, union_failures
 from .diagnostics import Diagnostics
+from .lower import program_blocks
 
 from .ast import (
     VarDecl,
@@ -16,14 +17,15 @@ from .ast import (
     IntLit,
     FloatLit,
     ExprStmt,
-    TryStmt,
     CatchStmt,
+    TryBlock,
     FuncDecl,
     BlockStmt,
     ReturnStmt,
+    LEAF_EXPR_TYPES,
 )
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Binding:
     ty: str
     mutable: bool   # let=False, var=True
@@ -33,15 +35,8 @@ def remove_failure(eff: FailureSet, name: str) -> FailureSet:
 
 def effect_expr(expr: Expr, env: Dict[str, Binding], syms) -> FailureSet:
 
-    # literals
-    if isinstance(expr, IntLit):
-        return EMPTY_FAILURES
-    
-    if isinstance(expr, FloatLit):
-        return EMPTY_FAILURES
-    
-    # identifier
-    if isinstance(expr, IdentExpr):
+    # literals / identifier
+    if isinstance(expr, LEAF_EXPR_TYPES):
         return EMPTY_FAILURES
     
     # call
@@ -70,15 +65,13 @@ def effect_call(call: CallExpr, env: Dict[str, Binding], syms) -> FailureSet:
 
     for a in call.args:
         # pos only
-        arg_effects.append(effect_expr(a.expr, env, syms))
+        arg_effects.append(effect_expr(a, env, syms))
 
     callee_eff: FailureSet = syms.sig_failures.get(call.callee, EMPTY_FAILURES)
     eff_args = union_failures(EMPTY_FAILURES, *arg_effects)
 
     # @handled なら callee の failure を落とす（引数の failure は残す）
-    attrs = syms.sig_attrs.get(call.callee, set())
-
-    if "handled" in attrs:
+    if call.callee in syms.handled:
         return eff_args
 
     return union_failures(callee_eff, eff_args)
@@ -110,37 +103,28 @@ def typecheck_program(prog, diags: Diagnostics) -> Dict[str, Binding]:
     typecheck_func_bodies(prog, syms)
     env: Dict[str, Binding] = {}
 
-    i = 0
-
-    while i < len(prog.items):
-
-        item = prog.items[i]
+    # try とその直後の catch 連鎖は lower.program_blocks で TryBlock にまとまっている
+    for item in program_blocks(prog):
 
         # --- try/catch (2行セット) ---
-        if isinstance(item, TryStmt):
-            # catch連鎖を集める
-            j = i + 1
-            catches = []
+        if isinstance(item, TryBlock):
 
-            while j < len(prog.items) and isinstance(prog.items[j], CatchStmt):
-                catches.append(prog.items[j])
-                j += 1
+            catches = item.catches
 
             if not catches:
                 raise TypecheckError("try must be followed by at least one catch")
             
             # --- try側 ---
-            t_try = type_expr(item.expr, expected=None, env=env, syms=syms)
+            try_expr = item.try_stmt.expr
+            t_try = type_expr(try_expr, expected=None, env=env, syms=syms)
 
             if t_try != "Unit":
                 raise TypecheckError(f"only Unit expression are allowed in try, got '{t_try}'")
             
-            eff_try = effect_expr(item.expr, env=env, syms=syms)
+            eff_try = effect_expr(try_expr, env=env, syms=syms)
 
             # try側から、catchされるfailureを全部消す
-            caught = {c.failure_name for c in catches}
-
-            for name in caught:
+            for name in item.catch_map:
                 eff_try = remove_failure(eff_try, name)
 
             # --- catch側 ---
@@ -166,9 +150,6 @@ def typecheck_program(prog, diags: Diagnostics) -> Dict[str, Binding]:
             if eff != EMPTY_FAILURES:
                 names = ", ".join(f.value for f in eff)
                 diags.warn("UNHANDLED_FAILURES", f"unhandled failures: {names}")
-            
-            # TryStmt + 連鎖 CatchStmt を全部消費
-            i = j
             continue
             
         # --- catch 単体は禁止 (try が消費するのは「次行の catch」のみ) ---
@@ -189,7 +170,6 @@ def typecheck_program(prog, diags: Diagnostics) -> Dict[str, Binding]:
                 diags.warn("UNHANDLED_FAILURES", f"unhandled failures: {names}")
             
             env[item.name] = Binding(ty=t, mutable=item.mutable)
-            i += 1
             continue
 
         # --- AssignStmt ---
@@ -211,7 +191,6 @@ def typecheck_program(prog, diags: Diagnostics) -> Dict[str, Binding]:
                 names = ", ".join(sorted(f.value for f in eff))
                 diags.warn("UNHANDLED_FAILURES", f"unhandled failures: {names}")
             
-            i += 1
             continue
 
         # --- ExprStmt ---
@@ -227,11 +206,9 @@ def typecheck_program(prog, diags: Diagnostics) -> Dict[str, Binding]:
             if t != "Unit":
                 raise TypecheckError(f"only Unit expression are allowed as statements, got '{t}'")
             
-            i += 1
             continue
 
         # --- それ以外（Catalog/Impl/func etc.）は型検査対象外 ---
-        i += 1
 
     return env
 
@@ -363,7 +340,7 @@ def type_call(call: CallExpr, expected: Optional[str], env: Dict[str, Binding],
             )
         
     # 引数exprを位置で取り出す
-    arg_exprs = [a.expr for a in call.args]
+    arg_exprs = call.args
 
     # ② 引数から型変数を推論
     for tref, aexpr in zip(sig.params, arg_exprs):
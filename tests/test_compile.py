@@ -0,0 +1,185 @@
+import contextlib
+import io
+import unittest
+
+from ginger.parser import parse
+from ginger.lower import lower_program
+from ginger.eval import eval_program
+from ginger.errors import EvalError
+from ginger.symbols_builder import build_symbols
+from ginger.compile import Compiler
+from ginger.builtin import ordering
+from ginger.ast import CallExpr, IdentExpr
+from ginger.runtime.failures import RaisedFailure, FailureId
+
+def _prog(src: str):
+    return lower_program(parse(src))
+
+def _run(prog):
+    # print の出力と env を返す
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        env = eval_program(prog)
+    return out.getvalue(), env
+
+# Int / Float / Ordering で別の builtin に落ちる guarantee（typecheck は通さない）
+PROBE = """guarantee Probe {
+    probe(self: Self) -> Self
+}
+impl Int guarantees Probe {
+    probe = builtin core.int.neg
+}
+impl Float guarantees Probe {
+    probe = builtin core.int.toFloat
+}
+impl Ordering guarantees Probe {
+    probe = builtin core.ordering.print
+}
+sig probe(T) -> T {
+    require T guarantees Probe
+}
+"""
+
+class UserFuncTest(unittest.TestCase):
+
+    FUNCS = """sig ident(Int) -> Int {
+}
+func ident(x: Int) {
+    return x
+}
+sig show(Int, Float) -> Unit {
+}
+func show(x: Int, y: Float) {
+    print(x)
+    print(y)
+}
+"""
+
+    def test_call_binds_params_by_position(self):
+        out, env = _run(_prog(self.FUNCS + "var a: Int = ident(3)\nshow(ident(a), 2.5)\n"))
+        self.assertEqual(out, "3\n2.5\n")
+        self.assertEqual(env["a"], 3)
+
+    def test_no_return_is_unit(self):
+        _, env = _run(_prog(self.FUNCS + "var u: Unit = show(1, 1.0)\n"))
+        self.assertIsNone(env["u"])
+
+    def test_argument_count_mismatch(self):
+        with self.assertRaises(EvalError) as cm:
+            _run(_prog(self.FUNCS + "ident(1, 2)\n"))
+        self.assertEqual(
+            str(cm.exception), "argument count mismatch in call to ident: expected 1, got 2"
+        )
+
+    def test_recursion(self):
+        # div(1.0, 0.0) で止まり、@attr.handled がその段で握る
+        src = """@attr.handled
+sig down(Float) -> Unit {
+    failure DivideByZero
+}
+func down(x: Float) {
+    print(div(1.0, x))
+    down(sub(x, 1.0))
+}
+down(2.0)
+print(7)
+"""
+        out, _ = _run(_prog(src))
+        self.assertEqual(out, "0.5\n1.0\n7\n")
+
+class HandledTest(unittest.TestCase):
+
+    SRC = """sig safe(Float) -> Unit {
+    failure DivideByZero
+}
+func safe(x: Float) {
+    print(div(x, 0.0))
+}
+safe(1.0)
+"""
+
+    def test_handled_swallows_failure(self):
+        out, _ = _run(_prog("@attr.handled\n" + self.SRC + "print(7)\n"))
+        self.assertEqual(out, "7\n")
+
+    def test_unhandled_failure_propagates(self):
+        with self.assertRaises(RaisedFailure) as cm:
+            _run(_prog(self.SRC))
+        self.assertIs(cm.exception.fid, FailureId.DivideByZero)
+
+class TryCatchTest(unittest.TestCase):
+
+    def test_matching_catch_runs(self):
+        out, _ = _run(_prog("try print(div(1.0, 0.0))\ncatch DivideByZero print(0)\nprint(1)\n"))
+        self.assertEqual(out, "0\n1\n")
+
+    def test_catch_skipped_on_success(self):
+        out, _ = _run(_prog("try print(div(4.0, 2.0))\ncatch DivideByZero print(0)\nprint(1)\n"))
+        self.assertEqual(out, "2.0\n1\n")
+
+    def test_no_matching_catch_reraises(self):
+        with self.assertRaises(RaisedFailure) as cm:
+            _run(_prog("try print(div(1.0, 0.0))\ncatch PrintErr print(0)\n"))
+        self.assertIs(cm.exception.fid, FailureId.DivideByZero)
+
+    def test_same_failure_in_catch_is_swallowed(self):
+        out, _ = _run(_prog(
+            "try print(div(1.0, 0.0))\ncatch DivideByZero print(div(2.0, 0.0))\nprint(1)\n"
+        ))
+        self.assertEqual(out, "1\n")
+
+class ImplCacheTest(unittest.TestCase):
+
+    def test_call_site_sees_int_then_float(self):
+        # 同じ call site（probe(x)）が Int の後に Float を受けても Float の impl を選ぶ
+        src = PROBE + """sig twice(Int) -> Int {
+}
+func twice(x: Int) {
+    return probe(x)
+}
+var a: Int = twice(3)
+var b: Float = twice(2.5)
+var c: Int = twice(4)
+"""
+        _, env = _run(_prog(src))
+        self.assertEqual((env["a"], env["b"], env["c"]), (-3, 2.5, -4))
+
+    def test_ordering_is_not_cached(self):
+        # tuple は中身で型が決まるので、Ordering の後の tuple も型を調べ直す
+        code = Compiler(build_symbols(_prog(PROBE))).expr(
+            CallExpr("probe", (IdentExpr("x"),), "pos")
+        )
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code({"x": ordering("Left")}, None)
+        self.assertEqual(out.getvalue(), "Left\n")
+
+        with self.assertRaises(EvalError) as cm:
+            code({"x": ("Point", "Left")}, None)
+        self.assertEqual(str(cm.exception), "unknown runtime value type: <class 'tuple'>")
+
+class RerunTest(unittest.TestCase):
+
+    SRC = """sig twice(Int) -> Int {
+}
+func twice(x: Int) {
+    return add(x, x)
+}
+var a: Int = twice(3)
+print(a)
+try print(div(1.0, 0.0))
+catch DivideByZero print(0)
+a = twice(a)
+"""
+
+    def test_repeated_eval_program(self):
+        prog = _prog(self.SRC)
+        results = [_run(prog) for _ in range(3)]
+        for out, env in results:
+            self.assertEqual(out, "6\n0\n")
+            self.assertEqual(env, {"a": 12})
+        # 実行ごとに新しい env を作る
+        self.assertIsNot(results[0][1], results[1][1])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from ginger.parser import parse
+from ginger.lower import lower_program
+from ginger.eval import eval_program
+from ginger.errors import EvalError
+
+
+def _prog(src: str):
+    return lower_program(parse(src))
+
+
+class RebindTest(unittest.TestCase):
+
+    SRC = "var x: Int = 1\nlet x: Int = 2\nx = 3\n"
+
+    def test_let_after_var_is_immutable(self):
+        with self.assertRaises(EvalError) as cm:
+            eval_program(_prog(self.SRC))
+        self.assertEqual(str(cm.exception), "cannot assign to immutable binding 'x'")
+
+    def test_let_after_var_is_immutable_on_rerun(self):
+        # 2回目以降は prog に保持したクロージャで実行する
+        prog = _prog(self.SRC)
+        for _ in range(3):
+            with self.assertRaises(EvalError):
+                eval_program(prog)
+
+    def test_var_after_let_is_mutable(self):
+        env = eval_program(_prog("let x: Int = 1\nvar x: Int = 2\nx = 3\n"))
+        self.assertEqual(env["x"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()